@@ -0,0 +1,165 @@
+"""Barrido de parámetros en paralelo sobre `Simulator` sin GUI.
+
+Cada combinación de la grilla se corre una vez por semilla en un
+`ProcessPoolExecutor`. Los resultados se agregan como líneas JSON al archivo
+de salida a medida que terminan, así que un barrido interrumpido se puede
+retomar: las combinaciones (parámetros, semilla) ya presentes se saltean.
+La semilla de cada trabajo es la del propio trabajo, por lo que el resultado
+no depende de cuántos procesos trabajen ni del orden en que terminen.
+
+Ejemplo:
+    python simulador_barrido.py --grid '{"quantum": [2, 5, 10], "prob_block": [10, 20]}' \\
+        --seeds 1-20 --out barrido.jsonl
+"""
+import argparse
+import itertools
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from simulador_so import ProcState, Simulator
+
+# parámetros de Simulator que se pueden barrer
+SWEEP_PARAMS = ("partitions_sizes", "quantum", "cpu_time_range", "prob_block",
+                "io_time_range", "admission", "scheduler", "memory", "fit", "compaction")
+
+
+def expand_grid(grid):
+    """Producto cartesiano de la grilla: lista de dicts de parámetros."""
+    unknown = set(grid) - set(SWEEP_PARAMS)
+    if unknown:
+        raise ValueError(f"parámetros desconocidos: {', '.join(sorted(unknown))}")
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+def job_key(params, seed):
+    return json.dumps({"params": params, "seed": seed}, sort_keys=True)
+
+def run_job(params, seed, n_procs=20, until_tick=None):
+    """Corre una simulación y devuelve sus métricas (se ejecuta en el worker)."""
+    kwargs = {k: tuple(v) if isinstance(v, list) and k.endswith("_range") else v
+              for k, v in params.items()}
+    sim = Simulator(seed=seed, **kwargs)
+    for _ in range(n_procs):
+        sim.add_process()
+    sim.run(until_tick=until_tick, until_idle=True)
+    return job_metrics(sim)
+
+def job_metrics(sim):
+    terminated = sim.state_counts[ProcState.TERMINATED]
+    return {
+        "ticks": sim.tick,
+        "terminated": terminated,
+        "waiting_mem": len(sim.wait_mem),
+        "throughput": terminated / sim.tick if sim.tick else 0.0,
+        "internal_fragmentation": sim.mem.internal_fragmentation(),
+        "external_fragmentation": sim.mem.external_fragmentation(),
+        # sólo contadores: las latencias del asignador varían entre corridas
+        "fit_misses": sim.mem.stats["misses"],
+        "compactions": sim.mem.stats["compactions"],
+        "mean_turnaround": sim.terminated.mean_turnaround(),
+        "mean_wait": sim.terminated.mean_wait(),
+    }
+
+
+def load_done(path):
+    """Claves de los trabajos ya escritos en `path` (ignora una última línea cortada)."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done.add(job_key(rec["params"], rec["seed"]))
+    return done
+
+def sweep(grid, seeds, out_path, n_procs=20, until_tick=None, workers=None):
+    """Corre los trabajos pendientes de la grilla y los agrega a `out_path`.
+    Devuelve cuántos trabajos se corrieron en esta llamada."""
+    done = load_done(out_path)
+    jobs = [(params, seed) for params in expand_grid(grid) for seed in seeds
+            if job_key(params, seed) not in done]
+    if not jobs:
+        return 0
+    # si la corrida anterior se cortó a mitad de línea, empezar en una línea nueva
+    if os.path.exists(out_path) and os.path.getsize(out_path):
+        with open(out_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+    else:
+        needs_newline = False
+    with open(out_path, "a", encoding="utf-8") as out, \
+         ProcessPoolExecutor(max_workers=workers) as pool:
+        if needs_newline:
+            out.write("\n")
+        futures = {pool.submit(run_job, params, seed, n_procs, until_tick): (params, seed)
+                   for params, seed in jobs}
+        for fut in as_completed(futures):
+            params, seed = futures[fut]
+            rec = {"params": params, "seed": seed, "metrics": fut.result()}
+            out.write(json.dumps(rec, sort_keys=True) + "\n")
+            out.flush()
+    return len(jobs)
+
+def aggregate(path):
+    """Promedio de cada métrica por combinación de parámetros: {params_json: {métrica: media}}."""
+    groups = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            groups[json.dumps(rec["params"], sort_keys=True)].append(rec["metrics"])
+    result = {}
+    for key, runs in groups.items():
+        metrics = {m for r in runs for m in r}
+        result[key] = {}
+        for m in sorted(metrics):
+            values = [r[m] for r in runs if m in r]   # registros viejos pueden no tenerla
+            result[key][m] = sum(values) / len(values)
+        result[key]["runs"] = len(runs)
+    return result
+
+
+def _parse_seeds(text):
+    seeds = []
+    for part in text.split(","):
+        if "-" in part:
+            lo, hi = (int(x) for x in part.split("-"))
+            seeds.extend(range(lo, hi + 1))
+        elif part.strip():
+            seeds.append(int(part))
+    return seeds
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros en paralelo.")
+    parser.add_argument("--grid", required=True,
+                        help="objeto JSON {parámetro: [valores]} o ruta a un archivo con él")
+    parser.add_argument("--seeds", required=True, type=_parse_seeds, help="ej: 1-20 o 1,5,9")
+    parser.add_argument("--out", required=True, help="archivo JSONL de resultados")
+    parser.add_argument("--procs", type=int, default=20, help="procesos iniciales por corrida")
+    parser.add_argument("--until-tick", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="por defecto, todos los núcleos")
+    args = parser.parse_args(argv)
+
+    grid_text = args.grid
+    if os.path.exists(grid_text):
+        with open(grid_text, encoding="utf-8") as f:
+            grid_text = f.read()
+    grid = json.loads(grid_text)
+
+    ran = sweep(grid, args.seeds, args.out, n_procs=args.procs,
+                until_tick=args.until_tick, workers=args.workers)
+    print(f"Trabajos corridos: {ran}")
+    for params, metrics in sorted(aggregate(args.out).items()):
+        print(params, " ".join(f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}"
+                               for k, v in metrics.items()))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
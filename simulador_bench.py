@@ -0,0 +1,214 @@
+"""Benchmarks del núcleo de la simulación (sin GUI).
+
+Cada escenario corre en un proceso nuevo, así el pico de memoria (RSS
+máximo del proceso) es el del escenario y no el de los anteriores. Se
+repite `--repeat` veces y se informa la mejor tasa.
+
+    procs-*    cantidad de procesos (hasta 100k procesos en 10k particiones)
+    parts-*    cantidad de particiones con los mismos procesos
+    block-*    probabilidad de bloqueo por tick
+    quantum-*  quantum de Round Robin
+    ff-*       run() con fast-forward (pocos procesos, tramos largos)
+    fit-*      Memory.fit sobre 10k particiones a medio ocupar
+    admit-*    fin de proceso + _try_admit_from_waiting con la espera llena
+    wake-*     _tick_blocked despertando 50k procesos bloqueados
+
+Los escenarios de simulación (procs, parts, block, quantum) avanzan tick a
+tick para medir step(); se informan en ticks/s, los micro en operaciones/s.
+El resultado se guarda como JSON (`--out`) y se puede comparar contra uno
+anterior (`--baseline`): si una tasa cae o un pico de memoria sube más que
+`--tolerance`, se listan las regresiones y el programa sale con código 1.
+
+Ejemplo:
+    python simulador_bench.py --out base.json
+    python simulador_bench.py --baseline base.json --only 'procs-*'
+"""
+import argparse
+import fnmatch
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from simulador_planificador import make_scheduler
+from simulador_so import Memory, Simulator, TerminatedStore
+
+try:
+    import resource
+except ImportError:   # Windows: sin pico de memoria
+    resource = None
+
+
+# ---------- escenarios ----------
+def _sim_scenario(procs, n_parts, ticks, fast_forward=False, part_size=16, **params):
+    def setup():
+        sim = Simulator(partitions_sizes=[part_size] * n_parts, seed=1, **params)
+        sim.terminated = TerminatedStore(keep_rows=False)
+        for _ in range(procs):
+            sim.add_process()
+        return sim
+    def body(sim):
+        sim.run(until_tick=sim.tick + ticks, until_idle=False, fast_forward=fast_forward)
+        # si la carga se terminó antes, se estaría midiendo step() en vacío
+        if sim.is_idle():
+            raise RuntimeError(f"el simulador quedó ocioso antes del tick {sim.tick}: "
+                               "achicar `ticks` o sumar procesos")
+        return ticks
+    return "ticks", setup, body
+
+def _fit_scenario(n_parts, lookups):
+    def setup():
+        r = random.Random(1)
+        mem = Memory([r.randint(1, 64) for _ in range(n_parts)])
+        for i in r.sample(range(n_parts), n_parts // 2):
+            mem.allocate(i, 1, mem.partitions[i].size)
+        return mem, [r.randint(1, 64) for _ in range(lookups)]
+    def body(state):
+        mem, reqs = state
+        fit = mem.fit
+        for req in reqs:
+            fit(req)
+        return len(reqs)
+    return "ops", setup, body
+
+def _admit_scenario(n_parts, waiting):
+    def setup():
+        sim = Simulator(partitions_sizes=[16] * n_parts, seed=1)
+        for _ in range(n_parts + waiting):
+            sim.add_process()
+        return sim, list(sim.ready)
+    def body(state):
+        # terminar a los admitidos uno por uno: cada fin libera una partición y
+        # admite desde la espera (la cola de listos queda desfasada, no se avanza)
+        sim, admitted = state
+        for p in admitted:
+            sim._finish_process(p)
+        return len(admitted)
+    return "ops", setup, body
+
+def _wake_scenario(procs, io_max):
+    def setup():
+        sim = Simulator(partitions_sizes=[16] * procs, seed=1, io_time_range=(1, io_max))
+        for _ in range(procs):
+            sim.add_process()
+        for p in list(sim.ready):
+            sim.running = p
+            sim._block_running(p)
+        sim.ready = make_scheduler(sim.scheduler, sim)
+        return sim
+    def body(sim):
+        end = sim.tick + io_max
+        while sim.tick < end:
+            sim.tick += 1
+            sim._tick_blocked()
+        return procs
+    return "ops", setup, body
+
+SCENARIOS = {
+    "procs-1k":    lambda: _sim_scenario(1_000, 100, 30_000),
+    "procs-10k":   lambda: _sim_scenario(10_000, 1_000, 50_000),
+    "procs-100k":  lambda: _sim_scenario(100_000, 10_000, 50_000),
+    "parts-100":   lambda: _sim_scenario(5_000, 100, 50_000),
+    "parts-1k":    lambda: _sim_scenario(5_000, 1_000, 50_000),
+    "parts-10k":   lambda: _sim_scenario(5_000, 10_000, 50_000),
+    "block-0":     lambda: _sim_scenario(2_000, 500, 50_000, prob_block=0),
+    "block-20":    lambda: _sim_scenario(2_000, 500, 50_000, prob_block=20),
+    "block-80":    lambda: _sim_scenario(2_000, 500, 50_000, prob_block=80),
+    "quantum-1":   lambda: _sim_scenario(2_000, 500, 50_000, quantum=1),
+    "quantum-5":   lambda: _sim_scenario(2_000, 500, 50_000, quantum=5),
+    "quantum-50":  lambda: _sim_scenario(2_000, 500, 50_000, quantum=50),
+    "ff-3procs":   lambda: _sim_scenario(3, 9, 5_000_000, fast_forward=True,
+                                         cpu_time_range=(10**9, 10**9), prob_block=1,
+                                         io_time_range=(50, 500)),
+    "fit-10k":     lambda: _fit_scenario(10_000, 200_000),
+    "admit-10k":   lambda: _admit_scenario(10_000, 50_000),
+    "wake-50k":    lambda: _wake_scenario(50_000, 1_000),
+}
+
+
+def run_scenario(name):
+    """Corre `name` una vez (en un proceso propio) y devuelve su medición."""
+    unit, setup, body = SCENARIOS[name]()
+    state = setup()
+    t0 = time.perf_counter()
+    ops = body(state)
+    seconds = time.perf_counter() - t0
+    peak = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = peak / 2**20 if sys.platform == "darwin" else peak / 2**10   # bytes vs KiB
+    return {"unit": unit, "ops": ops, "seconds": seconds,
+            "rate": ops / seconds if seconds > 0 else float("inf"), "peak_rss_mb": peak}
+
+def run_suite(names, repeat=3, log=print):
+    """Mejor de `repeat` corridas de cada escenario, cada una en un proceso nuevo."""
+    results = {}
+    ctx = multiprocessing.get_context("spawn")
+    for name in names:
+        runs = []
+        for _ in range(repeat):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                runs.append(pool.submit(run_scenario, name).result())
+        best = max(runs, key=lambda r: r["rate"])
+        results[name] = best
+        peak = f"{best['peak_rss_mb']:.1f} MB" if best["peak_rss_mb"] is not None else "-"
+        log(f"{name:<12} {best['rate']:>14,.0f} {best['unit']}/s   pico {peak}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Regresiones respecto de `baseline`: (escenario, qué, actual, base)."""
+    bad = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if cur["rate"] < base["rate"] * (1 - tolerance):
+            bad.append((name, f"{cur['unit']}/s", cur["rate"], base["rate"]))
+        if (cur["peak_rss_mb"] is not None and base.get("peak_rss_mb") is not None
+                and cur["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance)):
+            bad.append((name, "pico MB", cur["peak_rss_mb"], base["peak_rss_mb"]))
+    return bad
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del simulador (sin GUI).")
+    parser.add_argument("--only", action="append", metavar="PATRÓN",
+                        help="escenarios a correr (glob, p.ej. 'procs-*'); se puede repetir")
+    parser.add_argument("--list", action="store_true", help="listar los escenarios y salir")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default=None, help="guardar los resultados en este JSON")
+    parser.add_argument("--baseline", default=None, help="JSON de una corrida anterior")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="caída de tasa o suba de memoria admitida (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    names = [n for n in SCENARIOS
+             if not args.only or any(fnmatch.fnmatch(n, pat) for pat in args.only)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        parser.error("ningún escenario coincide con --only")
+
+    results = run_suite(names, repeat=max(1, args.repeat))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        bad = compare(results, baseline, args.tolerance)
+        for name, what, cur, base in bad:
+            print(f"REGRESIÓN {name}: {what} {cur:,.1f} (base {base:,.1f}, "
+                  f"{(cur - base) / base:+.0%})")
+        if bad:
+            return 1
+        print(f"Sin regresiones respecto de {args.baseline} (tolerancia {args.tolerance:.0%}).")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
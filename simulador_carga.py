@@ -0,0 +1,172 @@
+"""Cargas de trabajo para `Simulator.set_workload`: trazas en archivo y generadores.
+
+Todo se produce como generador de `Job`, un trabajo por vez, así que una
+traza de millones de trabajos se recorre en memoria constante. Las llegadas
+se cuentan en ticks desde que la carga se conecta al simulador y tienen que
+venir ordenadas.
+
+Formatos de archivo (opcionalmente comprimidos con gzip, `.gz`):
+    CSV    encabezado arrival,mem,cpu[,io][,priority]; `io` son duraciones separadas por ';'
+    JSONL  {"arrival": 0, "mem": 4, "cpu": 30, "io": [3, 5], "priority": 1} por línea
+
+Ejemplo:
+    python simulador_carga.py poisson --rate 0.05 --jobs 1000000 --seed 1 --out trabajos.csv.gz
+    python simulador_so.py --headless --procs 0 --workload trabajos.csv.gz
+"""
+import argparse
+import csv
+import gzip
+import json
+from collections import namedtuple
+
+from simulador_so import _parse_range, substream
+
+# io:       duraciones de los I/O sucesivos del trabajo (None = se sortean con io_time_range)
+# priority: para el planificador "priority", 0 = la más alta (None = se sortea)
+Job = namedtuple("Job", ["arrival", "mem", "cpu", "io", "priority"], defaults=(None, None))
+
+
+def _open(path, mode="r"):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+def _parse_int(value):
+    return None if value is None or value == "" else int(value)
+
+def _parse_io(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return tuple(int(x) for x in value.replace(",", ";").split(";") if x.strip())
+    return tuple(int(x) for x in value)
+
+def _job(rec, where):
+    """`Job` de un registro (dict) del archivo; `where` dice la línea para los errores."""
+    try:
+        job = Job(int(rec["arrival"]), int(rec["mem"]), int(rec["cpu"]),
+                  _parse_io(rec.get("io")), _parse_int(rec.get("priority")))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"{where}: trabajo mal formado ({e!r})") from None
+    if job.arrival < 0 or job.mem < 1 or job.cpu < 1:
+        raise ValueError(f"{where}: se espera arrival >= 0, mem >= 1 y cpu >= 1 "
+                         f"(arrival={job.arrival}, mem={job.mem}, cpu={job.cpu})")
+    return job
+
+def read_csv(path):
+    with _open(path) as f:
+        rows = csv.DictReader(f)
+        for row in rows:
+            yield _job(row, f"{path}, línea {rows.line_num}")
+
+def read_jsonl(path):
+    with _open(path) as f:
+        for n, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}, línea {n}: JSON inválido ({e})") from None
+            yield _job(rec, f"{path}, línea {n}")
+
+def read_workload(path):
+    """Lector perezoso según la extensión (.csv o .jsonl, con o sin .gz)."""
+    name = str(path)[:-3] if str(path).endswith(".gz") else str(path)
+    if name.endswith(".csv"):
+        return read_csv(path)
+    if name.endswith((".jsonl", ".json", ".ndjson")):
+        return read_jsonl(path)
+    raise ValueError(f"formato de carga desconocido: {path} (se espera .csv o .jsonl)")
+
+def write_workload(jobs, path):
+    """Escribe `jobs` en CSV o JSONL según la extensión; devuelve cuántos escribió."""
+    n = 0
+    name = str(path)[:-3] if str(path).endswith(".gz") else str(path)
+    with _open(path, "w") as f:
+        if name.endswith(".csv"):
+            out = csv.writer(f)
+            out.writerow(Job._fields)
+            for job in jobs:
+                out.writerow((job.arrival, job.mem, job.cpu, ";".join(map(str, job.io or ())),
+                              "" if job.priority is None else job.priority))
+                n += 1
+        else:
+            for job in jobs:
+                f.write(json.dumps(job._asdict()) + "\n")
+                n += 1
+    return n
+
+
+# ---------- generadores sintéticos ----------
+class _Draws:
+    """Sub-streams de un generador: brechas entre llegadas, memoria y CPU."""
+    def __init__(self, seed, mem_range, cpu_range):
+        self.gaps = substream(seed, "workload-gaps").rng
+        self._mem = substream(seed, "workload-mem")
+        self._cpu = substream(seed, "workload-cpu")
+        self.mem_range, self.cpu_range = mem_range, cpu_range
+    def job(self, t):
+        return Job(int(t), self._mem.randint(*self.mem_range), self._cpu.randint(*self.cpu_range))
+
+def poisson(rate, jobs=None, mem_range=(1, 12), cpu_range=(20, 60), seed=None):
+    """Llegadas de Poisson con `rate` trabajos por tick (brechas exponenciales)."""
+    if rate <= 0:
+        raise ValueError("rate debe ser positivo")
+    draws = _Draws(seed, mem_range, cpu_range)
+    t, n = 0.0, 0
+    while jobs is None or n < jobs:
+        t += draws.gaps.expovariate(rate)
+        yield draws.job(t)
+        n += 1
+
+def bursty(rate_high, rate_low, mean_high, mean_low, jobs=None,
+           mem_range=(1, 12), cpu_range=(20, 60), seed=None):
+    """Llegadas en ráfagas: alterna períodos de tasa alta y baja de duración
+    exponencial con media `mean_high` / `mean_low` ticks (Poisson modulado
+    por una cadena de dos estados). Empieza en un período de tasa alta."""
+    if min(mean_high, mean_low) <= 0 or min(rate_high, rate_low) < 0:
+        raise ValueError("las duraciones medias deben ser positivas y las tasas no negativas")
+    if rate_high == rate_low == 0:
+        raise ValueError("al menos una de las tasas debe ser positiva")
+    draws = _Draws(seed, mem_range, cpu_range)
+    t, n, high = 0.0, 0, True
+    end = draws.gaps.expovariate(1 / mean_high)
+    while jobs is None or n < jobs:
+        rate = rate_high if high else rate_low
+        gap = draws.gaps.expovariate(rate) if rate > 0 else float("inf")
+        if t + gap > end:
+            # sin memoria: al cambiar de período se sortea una brecha nueva
+            t, high = end, not high
+            end = t + draws.gaps.expovariate(1 / (mean_high if high else mean_low))
+            continue
+        t += gap
+        yield draws.job(t)
+        n += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generar una carga de trabajo sintética.")
+    parser.add_argument("kind", choices=("poisson", "bursty"))
+    parser.add_argument("--out", required=True, help="archivo .csv o .jsonl (con .gz comprime)")
+    parser.add_argument("--jobs", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--rate", type=float, default=0.05, help="trabajos por tick (poisson)")
+    parser.add_argument("--rate-high", type=float, default=0.5, help="tasa en ráfaga (bursty)")
+    parser.add_argument("--rate-low", type=float, default=0.01, help="tasa fuera de ráfaga (bursty)")
+    parser.add_argument("--mean-high", type=float, default=50, help="duración media de la ráfaga")
+    parser.add_argument("--mean-low", type=float, default=500, help="duración media de la calma")
+    parser.add_argument("--mem-range", type=_parse_range, default=(1, 12), metavar="MIN,MAX")
+    parser.add_argument("--cpu-range", type=_parse_range, default=(20, 60), metavar="MIN,MAX")
+    args = parser.parse_args(argv)
+
+    common = dict(jobs=args.jobs, mem_range=args.mem_range, cpu_range=args.cpu_range, seed=args.seed)
+    if args.kind == "poisson":
+        jobs = poisson(args.rate, **common)
+    else:
+        jobs = bursty(args.rate_high, args.rate_low, args.mean_high, args.mean_low, **common)
+    print(f"Trabajos escritos: {write_workload(jobs, args.out)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,580 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from simulador_so import ADMISSION_POLICIES, FIT_POLICIES, MEMORY_KINDS, ProcState, Simulator
+from simulador_carga import read_workload
+from simulador_planificador import SCHEDULERS
+from simulador_tabla import COL_TYPES, FILTERS, ProcessTable
+from simulador_traza import TraceReplayer
+from simulador_worker import SimWorker, sim_config
+
+# ============================
+#   GUI
+# ============================
+
+FRAME_MS = 33   # ~30 fps: la GUI dibuja sólo la última foto del worker
+
+class App(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Simulador de Procesos y Memoria")
+        self.geometry("1000x680")
+        self.minsize(720, 480)
+
+        # Modelo: vive en el hilo del worker; acá sólo se leen sus fotos
+        sim = Simulator(quantum=5, cpu_time_range=(20, 60))
+        for _ in range(5):
+            sim.add_process()
+        self._config = sim_config(sim)
+        self.worker = SimWorker(sim, ms_per_tick=300, auto=True, fps=1000 / FRAME_MS)
+
+        # Layout base
+        self.columnconfigure(0, weight=1, uniform="cols")
+        self.columnconfigure(1, weight=1, uniform="cols")
+        self.rowconfigure(0, weight=1)
+
+        # Panel memoria
+        self.canvas = tk.Canvas(self, bg="#1e1e1e", highlightthickness=0)
+        self.canvas.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+        # Panel derecho
+        right = ttk.Frame(self)
+        right.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
+        right.rowconfigure(3, weight=1)
+        right.columnconfigure(0, weight=1)
+
+        # Barra
+        controls = ttk.Frame(right)
+        controls.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        controls.grid_columnconfigure(3, weight=1)
+        self.auto_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(controls, text="Auto", variable=self.auto_var, command=self._toggle_loop)\
+            .grid(row=0, column=0, padx=6, pady=2, sticky="w")
+        ttk.Button(controls, text="Tick", command=self._tick_once)\
+            .grid(row=0, column=1, padx=6, pady=2, sticky="w")
+        ttk.Button(controls, text="Agregar proceso", command=self._add_proc)\
+            .grid(row=0, column=2, padx=6, pady=2, sticky="w")
+        self.stats_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(controls, text="Estadísticas", variable=self.stats_var, command=self._toggle_stats)\
+            .grid(row=0, column=3, padx=6, pady=2, sticky="e")
+        trace_btn = ttk.Menubutton(controls, text="Traza")
+        trace_menu = tk.Menu(trace_btn, tearoff=False)
+        trace_menu.add_command(label="Grabar…", command=self._start_recording)
+        trace_menu.add_command(label="Detener grabación", command=self._stop_recording)
+        trace_menu.add_separator()
+        trace_menu.add_command(label="Abrir y recorrer…", command=self._open_replay)
+        trace_menu.add_separator()
+        trace_menu.add_command(label="Cargar trabajos (CSV/JSONL)…", command=self._load_workload)
+        trace_btn["menu"] = trace_menu
+        trace_btn.grid(row=0, column=4, padx=6, pady=2, sticky="e")
+        ttk.Button(controls, text="Ajustes…", command=self._open_settings)\
+            .grid(row=0, column=5, padx=6, pady=2, sticky="e")
+
+        # Resumen y tabla
+        self.summary = ttk.Label(right, text="", anchor="w", justify="left")
+        self.summary.grid(row=1, column=0, sticky="ew", pady=(0, 8))
+
+        # Filtro por estado y búsqueda por PID
+        finder = ttk.Frame(right)
+        finder.grid(row=2, column=0, sticky="ew", pady=(0, 4))
+        finder.columnconfigure(4, weight=1)
+        ttk.Label(finder, text="Mostrar:").grid(row=0, column=0, sticky="w")
+        self.filter_var = tk.StringVar(value="Todos")
+        filter_box = ttk.Combobox(finder, width=16, textvariable=self.filter_var,
+                                  values=list(FILTERS), state="readonly")
+        filter_box.grid(row=0, column=1, sticky="w", padx=(4, 12))
+        filter_box.bind("<<ComboboxSelected>>", lambda _e: self._set_filter())
+        self.pid_var = tk.StringVar()
+        pid_entry = ttk.Entry(finder, width=8, textvariable=self.pid_var)
+        pid_entry.grid(row=0, column=2, sticky="w")
+        pid_entry.bind("<Return>", lambda _e: self._find_pid())
+        ttk.Button(finder, text="Buscar PID", command=self._find_pid).grid(row=0, column=3, padx=4)
+        self.table_info = ttk.Label(finder, text="", anchor="e", foreground="#555")
+        self.table_info.grid(row=0, column=4, sticky="e")
+
+        # La tabla es virtual: el Treeview sólo tiene las filas de la ventana
+        # visible y la barra de desplazamiento la maneja la App (_scroll_table)
+        table = ttk.Frame(right)
+        table.grid(row=3, column=0, sticky="nsew")
+        table.rowconfigure(0, weight=1); table.columnconfigure(0, weight=1)
+        self.tree = ttk.Treeview(
+            table, columns=("pid", "estado", "mem", "part", "cpu", "io"),
+            show="headings", height=18
+        )
+        for col, text, w in [
+            ("pid", "PID", 60), ("estado", "Estado", 110), ("mem", "Mem", 60),
+            ("part", "Part", 60), ("cpu", "CPU restante", 100), ("io", "I/O restante", 100)
+        ]:
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=w, anchor="center")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vbar = ttk.Scrollbar(table, orient="vertical", command=self._scroll_table)
+        self.vbar.grid(row=0, column=1, sticky="ns")
+        self.tree.bind("<Configure>", self._resize_table)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._wheel)
+        self._row_h = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+
+        # Panel de estadísticas (simulador_metricas.py), visible con el botón
+        self.stats = ttk.Label(right, text="", anchor="w", justify="left", font="TkFixedFont")
+
+        # Ordenable con flechas y orden persistente
+        self._setup_sorting()
+
+        # Velocidad del loop
+        self.ms_var = tk.IntVar(value=300)
+
+        # Estado de los renderers incrementales (copia local de la última foto)
+        self._table = ProcessTable()
+        self._offset = 0       # primera fila visible
+        self._page = 18        # filas que entran en el Treeview
+        self._shown = []       # (iid, valores) de las filas en pantalla
+        self._found_pid = None
+        self._parts = []
+        self._part_items = []
+        self._drawn_size = None
+        self._snap = None
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self.worker.start()
+        self.after(FRAME_MS, self._frame)
+
+    # --- básicos ---
+    def _add_proc(self): self.worker.send("add")
+    def _tick_once(self): self.worker.send("step")
+    def _toggle_loop(self): self.worker.send("auto", self.auto_var.get())
+    def _toggle_stats(self):
+        on = self.stats_var.get()
+        self.worker.send("metrics", on)
+        if on:
+            self.stats.grid(row=4, column=0, sticky="ew", pady=(8, 0))
+        else:
+            self.stats.grid_remove()
+    def _frame(self):
+        snap = self.worker.latest()
+        if snap is not None:
+            self._render_all(snap)
+        elif self._snap is not None and self._canvas_size() != self._drawn_size:
+            self._render_memory(full=True)
+        self.after(FRAME_MS, self._frame)
+    def _close(self):
+        self.worker.stop()
+        self.destroy()
+
+    # ---------- AJUSTES (ventana) ----------
+    def _open_settings(self):
+        win = tk.Toplevel(self); win.title("Ajustes de simulación")
+        win.grab_set(); win.resizable(False, False)
+        frm = ttk.Frame(win, padding=12); frm.pack(fill="both", expand=True)
+
+        # Velocidad
+        ttk.Label(frm, text="Velocidad (ms por tick):").grid(row=0, column=0, sticky="e", pady=2)
+        ms_var_local = tk.IntVar(value=self.ms_var.get())
+        ttk.Entry(frm, width=8, textvariable=ms_var_local).grid(row=0, column=1, sticky="w", padx=6)
+        ttk.Label(frm, text="Cada tick avanza la simulación.\nMás ms = más lento; menos ms = más rápido.\n"
+                            "0 = lo más rápido posible (la pantalla se refresca a ~30 fps).",
+                  foreground="#555").grid(row=1, column=0, columnspan=2, sticky="w")
+
+        # Quantum
+        ttk.Label(frm, text="Quantum (RR; base de la MLFQ):").grid(row=2, column=0, sticky="e", pady=(10,2))
+        cfg = self._config
+        quantum_var = tk.IntVar(value=cfg["quantum"])
+        ttk.Entry(frm, width=8, textvariable=quantum_var).grid(row=2, column=1, sticky="w", padx=6)
+        ttk.Label(frm, text="Ticks que un proceso puede usar CPU antes de ser desalojado\nsi hay otros listos.",
+                  foreground="#555").grid(row=3, column=0, columnspan=2, sticky="w")
+
+        # CPU inicial
+        ttk.Label(frm, text="CPU inicial mín–máx (procesos nuevos):").grid(row=4, column=0, columnspan=2, sticky="w", pady=(10,2))
+        cpu_min_var = tk.IntVar(value=cfg["cpu_time_range"][0])
+        cpu_max_var = tk.IntVar(value=cfg["cpu_time_range"][1])
+        ttk.Entry(frm, width=6, textvariable=cpu_min_var).grid(row=5, column=0, sticky="w")
+        ttk.Entry(frm, width=6, textvariable=cpu_max_var).grid(row=5, column=1, sticky="w")
+        ttk.Label(frm, text="Duración total de CPU de los procesos al crearse.",
+                  foreground="#555").grid(row=6, column=0, columnspan=2, sticky="w")
+
+        # Prob. bloqueo
+        ttk.Label(frm, text="Prob. de bloqueo por tick (%):").grid(row=7, column=0, sticky="e", pady=(10,2))
+        prob_block_var = tk.IntVar(value=cfg["prob_block"])
+        ttk.Entry(frm, width=8, textvariable=prob_block_var).grid(row=7, column=1, sticky="w", padx=6)
+        ttk.Label(frm, text="Probabilidad de que el proceso en CPU pase a Bloqueado (I/O).",
+                  foreground="#555").grid(row=8, column=0, columnspan=2, sticky="w")
+
+        # Rango I/O
+        ttk.Label(frm, text="Rango de I/O mín–máx (ticks):").grid(row=9, column=0, columnspan=2, sticky="w", pady=(10,2))
+        io_min_var = tk.IntVar(value=cfg["io_time_range"][0])
+        io_max_var = tk.IntVar(value=cfg["io_time_range"][1])
+        ttk.Entry(frm, width=6, textvariable=io_min_var).grid(row=10, column=0, sticky="w")
+        ttk.Entry(frm, width=6, textvariable=io_max_var).grid(row=10, column=1, sticky="w")
+        ttk.Label(frm, text="Cuántos ticks permanece bloqueado un proceso por I/O.",
+                  foreground="#555").grid(row=11, column=0, columnspan=2, sticky="w")
+
+        # Aplicar a existentes
+        apply_existing_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frm, text="Aplicar nuevo rango de CPU a procesos existentes",
+                        variable=apply_existing_var).grid(row=12, column=0, columnspan=2, sticky="w", pady=(10,0))
+        ttk.Label(frm, text="Si está marcado, reasigna la CPU restante de los procesos activos al nuevo rango.",
+                  foreground="#555").grid(row=13, column=0, columnspan=2, sticky="w")
+
+        # Particiones (opcional)
+        use_new_mem_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frm, text="Reiniciar particiones de memoria", variable=use_new_mem_var)\
+            .grid(row=14, column=0, columnspan=2, sticky="w", pady=(10,0))
+        ttk.Label(frm, text="Si lo activás, ingresá una lista (ej: 4,4,8,16).\n"
+                            "Se reinicia la memoria y los procesos vuelven a espera.",
+                  foreground="#555").grid(row=15, column=0, columnspan=2, sticky="w")
+        mem_parts_var = tk.StringVar(value="2,2,4,6,6,8,8,12,16")
+        mem_entry = ttk.Entry(frm, width=30, textvariable=mem_parts_var, state="disabled")
+        mem_entry.grid(row=16, column=0, columnspan=2, sticky="ew", pady=(2,0))
+        def toggle_entry(*_):
+            mem_entry.configure(state="normal" if use_new_mem_var.get() else "disabled")
+        use_new_mem_var.trace_add("write", toggle_entry)
+
+        # Admisión desde la espera de memoria
+        ttk.Label(frm, text="Admisión desde espera de memoria:").grid(row=17, column=0, sticky="e", pady=(10,2))
+        admission_var = tk.StringVar(value=cfg["admission"])
+        ttk.Combobox(frm, width=8, textvariable=admission_var, values=ADMISSION_POLICIES,
+                     state="readonly").grid(row=17, column=1, sticky="w", padx=6)
+        ttk.Label(frm, text="fifo: sólo el primero de la cola. first: el más antiguo que entre.\n"
+                            "best: el de mayor pedido que entre.",
+                  foreground="#555").grid(row=18, column=0, columnspan=2, sticky="w")
+
+        # Planificador de CPU
+        ttk.Label(frm, text="Planificador de CPU:").grid(row=19, column=0, sticky="e", pady=(10,2))
+        scheduler_var = tk.StringVar(value=cfg["scheduler"])
+        ttk.Combobox(frm, width=8, textvariable=scheduler_var, values=list(SCHEDULERS),
+                     state="readonly").grid(row=19, column=1, sticky="w", padx=6)
+        ttk.Label(frm, text="rr: Round Robin. sjf / srtf: menor CPU restante (srtf desaloja).\n"
+                            "priority: mayor prioridad primero. mlfq: colas multinivel.",
+                  foreground="#555").grid(row=20, column=0, columnspan=2, sticky="w")
+
+        # Asignador de memoria
+        ttk.Label(frm, text="Memoria / ajuste:").grid(row=21, column=0, sticky="e", pady=(10,2))
+        mem_row = ttk.Frame(frm); mem_row.grid(row=21, column=1, sticky="w", padx=6)
+        memory_var = tk.StringVar(value=cfg["memory"])
+        ttk.Combobox(mem_row, width=8, textvariable=memory_var, values=MEMORY_KINDS,
+                     state="readonly").pack(side="left")
+        fit_var = tk.StringVar(value=cfg["fit"])
+        ttk.Combobox(mem_row, width=7, textvariable=fit_var, values=FIT_POLICIES,
+                     state="readonly").pack(side="left", padx=(6,0))
+        compaction_var = tk.BooleanVar(value=cfg["compaction"])
+        ttk.Checkbutton(frm, text="Compactar la memoria dinámica cuando haga falta",
+                        variable=compaction_var).grid(row=22, column=0, columnspan=2, sticky="w")
+        ttk.Label(frm, text="fixed: particiones fijas. dynamic: bloques a medida sobre la suma de las\n"
+                            "particiones. buddy: bloques de 2^k (ignora el ajuste). Cambiar el tipo\n"
+                            "reinicia la memoria.",
+                  foreground="#555").grid(row=23, column=0, columnspan=2, sticky="w")
+
+        # Botones
+        btns = ttk.Frame(frm); btns.grid(row=24, column=0, columnspan=2, pady=(16,0), sticky="e")
+        ttk.Button(btns, text="Cancelar", command=win.destroy).pack(side="right", padx=6)
+        def apply_and_close():
+            try:
+                ms=int(ms_var_local.get()); q=int(quantum_var.get())
+                cmin=int(cpu_min_var.get()); cmax=int(cpu_max_var.get())
+                pbl=int(prob_block_var.get()); iomin=int(io_min_var.get()); iomax=int(io_max_var.get())
+                assert ms>=0 and q>=1 and 1<=cmin<cmax and 0<=pbl<=100 and 1<=iomin<=iomax
+                if use_new_mem_var.get():
+                    new_parts=[int(x) for x in mem_parts_var.get().split(",") if x.strip()]
+                    assert new_parts and all(s>0 for s in new_parts)
+            except Exception:
+                messagebox.showerror("Error","Valores inválidos."); return
+
+            # el simulador se modifica en su propio hilo, al procesar la orden
+            self.ms_var.set(ms)
+            self.worker.send("speed", ms)
+            self.worker.send("configure", dict(
+                quantum=q, cpu_time_range=(cmin, cmax), prob_block=pbl,
+                io_time_range=(iomin, iomax), admission=admission_var.get(),
+                scheduler=scheduler_var.get(), reassign_cpu=apply_existing_var.get(),
+                partitions_sizes=new_parts if use_new_mem_var.get() else None,
+                memory=memory_var.get(), fit=fit_var.get(), compaction=compaction_var.get()))
+            win.destroy()
+        ttk.Button(btns, text="Aplicar", command=apply_and_close).pack(side="right")
+
+    # ---------- TRAZA ----------
+    def _start_recording(self):
+        path = filedialog.asksaveasfilename(parent=self, title="Grabar traza",
+                                            defaultextension=".trz",
+                                            filetypes=[("Traza del simulador", "*.trz")])
+        if path:
+            self.worker.send("record", path)
+
+    def _stop_recording(self): self.worker.send("record", None)
+
+    def _load_workload(self):
+        path = filedialog.askopenfilename(parent=self, title="Cargar trabajos",
+                                          filetypes=[("Carga de trabajo", "*.csv *.jsonl *.gz")])
+        if not path:
+            return
+        try:
+            # revisa la extensión y el primer trabajo; el worker lo lee de a poco
+            # y un error más adelante en el archivo llega con la foto (snap.error)
+            next(read_workload(path), None)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Error", f"No se pudo leer la carga:\n{e}"); return
+        self.worker.send("workload", path)
+
+    def _open_replay(self):
+        path = filedialog.askopenfilename(parent=self, title="Abrir traza",
+                                          filetypes=[("Traza del simulador", "*.trz")])
+        if not path:
+            return
+        try:
+            rep = TraceReplayer(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo abrir la traza:\n{e}"); return
+
+        win = tk.Toplevel(self); win.title(f"Traza: {path}")
+        win.geometry("620x480")
+        frm = ttk.Frame(win, padding=10); frm.pack(fill="both", expand=True)
+        frm.columnconfigure(0, weight=1); frm.rowconfigure(2, weight=1)
+
+        first, last = rep.first_tick(), rep.last_tick()
+        tick_var = tk.IntVar(value=first)
+        ttk.Scale(frm, from_=first, to=max(last, first + 1), orient="horizontal",
+                  command=lambda v: tick_var.set(int(float(v))))\
+            .grid(row=0, column=0, sticky="ew")
+        info = ttk.Label(frm, anchor="w"); info.grid(row=1, column=0, sticky="ew", pady=(6, 6))
+
+        panes = ttk.Frame(frm); panes.grid(row=2, column=0, sticky="nsew")
+        panes.columnconfigure(0, weight=3); panes.columnconfigure(1, weight=2); panes.rowconfigure(0, weight=1)
+        procs = ttk.Treeview(panes, columns=("pid", "estado", "mem", "part", "cpu", "io"), show="headings")
+        for col, text, w in [("pid", "PID", 50), ("estado", "Estado", 90), ("mem", "Mem", 50),
+                             ("part", "Part", 50), ("cpu", "CPU", 60), ("io", "I/O", 50)]:
+            procs.heading(col, text=text); procs.column(col, width=w, anchor="center")
+        procs.grid(row=0, column=0, sticky="nsew", padx=(0, 6))
+        parts = ttk.Treeview(panes, columns=("blk", "size", "pid", "used"), show="headings")
+        for col, text, w in [("blk", "Bloque", 55), ("size", "Size", 50), ("pid", "PID", 50), ("used", "Usado", 55)]:
+            parts.heading(col, text=text); parts.column(col, width=w, anchor="center")
+        parts.grid(row=0, column=1, sticky="nsew")
+
+        # el Scale dispara muchos eventos al arrastrar: se dibuja sólo el último tick pedido
+        shown = [None]
+        def show(*_):
+            tick = tick_var.get()
+            if tick == shown[0]:
+                return
+            shown[0] = tick
+            st = rep.state_at(tick)
+            procs.delete(*procs.get_children())
+            for row in sorted(st.procs):
+                procs.insert("", "end", values=row)
+            parts.delete(*parts.get_children())
+            for i, size, owner, occupied in st.partitions:
+                parts.insert("", "end", values=(i, size, "-" if owner is None else owner, occupied))
+            info.config(text=f"Tick {tick} de {first}–{last} | procesos vivos: {len(st.procs)} "
+                             f"| terminados: {st.terminated} | eventos en la traza: {rep.n_events}")
+        tick_var.trace_add("write", lambda *_: win.after_idle(show))
+        show()
+        def close():
+            rep.close(); win.destroy()
+        win.protocol("WM_DELETE_WINDOW", close)
+
+    # ---------- RENDER ----------
+    # Los renderers guardan las filas de la tabla (iid = PID) y los ítems del
+    # canvas entre frames, y sólo tocan lo que la foto del worker trae como
+    # cambiado (todo, si la foto es completa).
+    def _render_all(self, snap):
+        self._snap = snap
+        self._config = snap.config
+        if snap.mem_reset:
+            self._parts = [None] * snap.n_partitions
+        for i, size, owner, occupied, color in snap.partitions:
+            self._parts[i] = (size, owner, occupied, color)
+        self._render_memory([b[0] for b in snap.partitions], full=snap.mem_reset)
+        self._render_processes(snap.rows, full=snap.full)
+        self._render_summary()
+        if snap.metrics is not None:
+            self._render_stats(snap.metrics)
+        if snap.error is not None:
+            messagebox.showerror("Error", snap.error)
+
+    def _render_summary(self):
+        snap = self._snap
+        total = snap.mem_total
+        used  = snap.mem_used
+        free  = total - used
+        counts = snap.counts
+        ready = counts[ProcState.READY.value]
+        running = counts[ProcState.RUNNING.value]
+        blocked = counts[ProcState.BLOCKED.value]
+        term    = counts[ProcState.TERMINATED.value]
+        wait_mem= snap.wait_mem
+        cfg = snap.config
+        cpu_rng = f"{cfg['cpu_time_range'][0]}–{cfg['cpu_time_range'][1]}"
+        self.summary.config(text=(
+            f"Tick: {snap.tick} | "
+            f"Memoria: usada {used}/{total} (libre {free}, mayor libre {snap.mem_largest_free}, "
+            f"frag. interna {snap.mem_internal_frag}, frag. externa {snap.mem_external_frag:.0%}) | "
+            f"Listo: {ready} Ejecutando: {running} Bloqueado: {blocked} "
+            f"Terminado: {term} Espera Memoria: {wait_mem} | "
+            f"CPU inicial: {cpu_rng} | Planificador: {cfg['scheduler']} | Quantum: {cfg['quantum']} | "
+            f"Memoria: {cfg['memory']}/{cfg['fit']} | "
+            f"ms/tick: {self.ms_var.get()}"
+        ))
+
+    def _render_stats(self, m):
+        c = m["counters"]
+        ph = m["phase_us"]
+        hist = "\n".join(f"  {label:<10} media {mean:8.1f}  p50 ≤ {p50:<6} p95 ≤ {p95:<6} (n={n})"
+                         for label, (mean, p50, p95, n) in
+                         zip(("Espera", "Respuesta", "Retorno"), m["histograms"].values()))
+        self.stats.config(text=(
+            f"Cambios de contexto: {c['context_switches']}  Desalojos: {c['preemptions']}  "
+            f"Bloqueos I/O: {c['io_blocks']}  Admisiones: {c['admissions']}  "
+            f"Compactaciones: {c['compactions']}\n"
+            f"µs/tick: llegadas {ph['arrivals']:.1f}  admisión {ph['admit']:.1f}  "
+            f"despacho {ph['dispatch']:.1f}  CPU {ph['running']:.1f}  I/O {ph['blocked']:.1f}  "
+            f"({m['steps']} ticks medidos, {m['skipped']} salteados)\n"
+            f"Ticks por proceso terminado:\n{hist}"
+        ))
+
+    def _canvas_size(self):
+        return (self.canvas.winfo_width() or 450, self.canvas.winfo_height() or 450)
+
+    def _render_memory(self, parts=(), full=False):
+        W, H = self._canvas_size()
+        blocks = self._parts
+        if full or (W, H) != self._drawn_size:
+            self.canvas.delete("all")
+            self._drawn_size = (W, H)
+            margin = 20; gap = 10
+            total_h = H - 2*margin - gap*(len(blocks)-1)
+            block_h = total_h / len(blocks) if blocks else 0
+            x0, x1 = margin, W - margin
+            self._part_items = []
+            for i in range(len(blocks)):
+                y0 = margin + i*(block_h + gap); y1 = y0 + block_h
+                self.canvas.create_rectangle(x0, y0, x1, y1, outline="#aaa", width=2)
+                used = self.canvas.create_rectangle(x0, y0, x0, y1, outline="")
+                free = self.canvas.create_rectangle(x0, y0, x1, y1, fill="#2b2b2b", outline="")
+                text = self.canvas.create_text(x0+8, (y0+y1)/2, anchor="w")
+                self._part_items.append((x0, y0, x1, y1, used, free, text))
+            parts = range(len(blocks))
+
+        for i in parts:
+            size, owner, occupied, color = blocks[i]
+            x0, y0, x1, y1, used, free, text = self._part_items[i]
+            if owner is None:
+                self.canvas.coords(used, x0, y0, x0, y1)
+                self.canvas.coords(free, x0, y0, x1, y1)
+                self.canvas.itemconfigure(text, fill="#ddd",
+                                          text=f"Bloque {i} size={size} (LIBRE)")
+            else:
+                frac = max(0.0, min(1.0, occupied/size if size > 0 else 0))
+                fill_w = x0 + frac*(x1 - x0)
+                self.canvas.coords(used, x0, y0, fill_w, y1)
+                self.canvas.itemconfigure(used, fill=color)
+                self.canvas.coords(free, fill_w, y0, x1, y1)
+                self.canvas.itemconfigure(text, fill="#fff",
+                                          text=f"Bloque {i} size={size} used={occupied} PID={owner}")
+
+    def _render_processes(self, rows=(), full=False):
+        table = self._table
+        if full:
+            table.load(rows)
+        elif rows is not None:
+            for values in rows:
+                table.update(values)
+        self._render_window()
+
+    def _render_window(self):
+        """Vuelca al Treeview sólo las filas de la ventana visible."""
+        table = self._table
+        total = len(table)
+        self._offset = max(0, min(self._offset, total - self._page))
+        window = table.window(self._offset, self._page)
+        wanted = [(str(v[0]), v) for v in window]
+        if [iid for iid, _ in wanted] != [iid for iid, _ in self._shown]:
+            self.tree.delete(*self.tree.get_children())
+            for iid, values in wanted:
+                self.tree.insert("", "end", iid=iid, values=values)
+        else:
+            for (iid, values), (_, old) in zip(wanted, self._shown):
+                if values != old:
+                    self.tree.item(iid, values=values)
+        self._shown = wanted
+        if self._found_pid is not None and str(self._found_pid) in self.tree.get_children():
+            self.tree.selection_set(str(self._found_pid))
+        if total:
+            self.vbar.set(self._offset / total, min(1.0, (self._offset + self._page) / total))
+            shown = f"{self._offset + 1}–{self._offset + len(window)} de {total}"
+        else:
+            self.vbar.set(0.0, 1.0)
+            shown = "sin filas"
+        self.table_info.config(text=f"{shown} ({len(table.rows)} procesos)")
+
+    def _scroll_table(self, action, amount, unit=None):
+        """Comando de la barra: ("moveto", fracción) o ("scroll", n, "units"/"pages")."""
+        total = len(self._table)
+        if action == "moveto":
+            self._offset = int(float(amount) * total)
+        else:
+            step = self._page if unit == "pages" else 1
+            self._offset += int(amount) * step
+        self._render_window()
+
+    def _wheel(self, event):
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._scroll_table("scroll", -3 if up else 3, "units")
+        return "break"
+
+    def _resize_table(self, event):
+        # encabezado ~ una fila
+        page = max(1, event.height // self._row_h - 1)
+        if page != self._page:
+            self._page = page
+            self._render_window()
+
+    def _set_filter(self):
+        self._table.set_filter(self.filter_var.get())
+        self._offset = 0
+        self._render_window()
+
+    def _find_pid(self):
+        try:
+            pid = int(self.pid_var.get())
+        except ValueError:
+            self.table_info.config(text="PID inválido"); return
+        pos = self._table.position(pid)
+        if pos is None:
+            hidden = pid in self._table.rows
+            self.table_info.config(text=f"PID {pid} " + ("oculto por el filtro" if hidden else "no existe"))
+            return
+        self._found_pid = pid
+        self._offset = pos - self._page // 2
+        self._render_window()
+        self.tree.see(str(pid))
+
+    # ---------- ORDENAMIENTO PERSISTENTE ----------
+    def _setup_sorting(self):
+        self._col_types = COL_TYPES
+        self._col_titles = {c: self.tree.heading(c, "text") for c in self._col_types}
+        self._sort_reverse = {c: True for c in self._col_types}  # 1er click: DESC
+
+        for col in self._col_types:
+            self.tree.heading(
+                col,
+                text=self._col_titles[col],
+                command=lambda c=col: self._sort_by(c, self._sort_reverse[c])
+            )
+
+    def _sort_by(self, col, reverse):
+        # alternar para el próximo click
+        self._sort_reverse[col] = not reverse
+
+        # actualizar flechas en encabezados
+        for c in self._col_types:
+            base = self._col_titles[c]
+            if c == col:
+                base = f"{base} {'▼' if reverse else '▲'}"
+            self.tree.heading(c, text=base,
+                              command=lambda cc=c: self._sort_by(cc, self._sort_reverse[cc]))
+
+        # la tabla recuerda el orden para los próximos renders; el índice de la
+        # columna se arma la primera vez y después se mantiene al día
+        self._table.set_sort(col, reverse)
+        self._render_processes(None)
+
+if __name__ == "__main__":
+    App().mainloop()
@@ -0,0 +1,440 @@
+"""Asignadores de memoria de `Simulator`.
+
+    fixed    particiones fijas (el esquema original)
+    dynamic  particionamiento dinámico: los bloques se cortan a la medida del
+             pedido y al liberar se fusionan con los huecos vecinos;
+             compactación opcional
+    buddy    sistema buddy: bloques de 2**k, se parten a la mitad al asignar y
+             se vuelven a juntar con su buddy al liberar
+
+`fixed` y `dynamic` eligen el hueco con la política `fit` (first, next, best,
+worst): first y next con un árbol de segmentos de máximos por posición
+(O(log n)), best y worst con un índice ordenado por tamaño. Todos exponen la
+misma interfaz (`fit`, `allocate`, `free`, `partitions`, contadores) y miden
+cuánto tardan sus operaciones y cuánta fragmentación dejan (`report`).
+
+`partitions` es la lista de bloques en orden de dirección (ocupados y libres)
+que dibuja la GUI. En `fixed` es fija y `dirty` dice qué índices cambiaron; en
+los otros cambia de forma con cada operación, y `version` aumenta cuando pasa.
+El identificador de un bloque (lo que guarda `Process.mem_index`) es su
+`start`: el índice de la partición en `fixed`, la dirección en los demás.
+"""
+from bisect import bisect_left, bisect_right, insort
+from time import perf_counter_ns
+
+MEMORY_KINDS = ("fixed", "dynamic", "buddy")
+FIT_POLICIES = ("first", "next", "best", "worst")
+
+
+class MemoryPartition:
+    def __init__(self, size: int, start: int = 0):
+        self.size = size
+        self.start = start
+        self.owner_pid = None
+        self.occupied = 0
+    def is_free(self):
+        return self.owner_pid is None
+
+
+class _MaxTree:
+    """Árbol de segmentos con el máximo de cada rango de posiciones (-1 = nada)."""
+    def __init__(self, n):
+        self.leaves = 1
+        while self.leaves < n:
+            self.leaves *= 2
+        self.t = [-1] * (2 * self.leaves)
+    def build(self):
+        t = self.t
+        for node in range(self.leaves - 1, 0, -1):
+            t[node] = max(t[2*node], t[2*node + 1])
+    def set(self, i, value):
+        t = self.t
+        node = self.leaves + i
+        t[node] = value
+        node //= 2
+        while node:
+            left, right = t[2*node], t[2*node + 1]
+            best = left if left > right else right
+            if t[node] == best:
+                break   # de acá para arriba no cambia nada
+            t[node] = best
+            node //= 2
+    def max(self): return self.t[1]
+    def leftmost(self, req, lo=0):
+        """Menor posición >= lo con valor >= req, o None."""
+        t = self.t
+        if t[1] < req or lo >= self.leaves:
+            return None
+        node = self.leaves + lo
+        if t[node] < req:
+            # subir hasta un hermano derecho que alcance
+            while node > 1:
+                if node % 2 == 0 and t[node + 1] >= req:
+                    node += 1
+                    break
+                node //= 2
+            else:
+                return None
+        while node < self.leaves:
+            node *= 2
+            if t[node] < req:
+                node += 1
+        return node - self.leaves
+
+
+class _SizeIndex:
+    """Huecos libres ordenados por (tamaño, posición)."""
+    def __init__(self):
+        self.items = []
+    def add(self, size, key): insort(self.items, (size, key))
+    def remove(self, size, key): del self.items[bisect_left(self.items, (size, key))]
+    def best(self, req):
+        i = bisect_left(self.items, (req, -1))
+        return self.items[i][1] if i < len(self.items) else None
+    def worst(self, req):
+        return self.items[-1][1] if self.items and self.items[-1][0] >= req else None
+
+
+class _Allocator:
+    kind = None
+    STATS = ("fits", "misses", "allocs", "frees", "fit_ns", "alloc_ns", "free_ns",
+             "compactions", "moved")
+
+    def __init__(self, fit="first"):
+        self.set_fit(fit)
+        self.compaction = False
+        self.dirty = set()   # índices de `partitions` que cambiaron (sólo fixed)
+        self.version = 0     # cambia cuando `partitions` cambia de forma
+        self._total = 0
+        self._used = 0
+        self._internal_frag = 0
+        self.stats = dict.fromkeys(self.STATS, 0)
+
+    def set_fit(self, fit):
+        if fit not in FIT_POLICIES:
+            raise ValueError(f"política de ajuste desconocida: {fit!r}")
+        self.fit_policy = fit
+    def set_compaction(self, on):
+        self.compaction = bool(on) and hasattr(self, "compact")
+
+    def total_size(self): return self._total
+    def used_size(self):  return self._used
+    def free_size(self):  return self._total - self._used
+    def internal_fragmentation(self):
+        """Memoria asignada pero sin usar: suma de size - occupied de los ocupados."""
+        return self._internal_frag
+    def external_fragmentation(self):
+        """Fracción de la memoria libre que queda fuera del mayor hueco (0 = toda junta)."""
+        free = self._total - self._used - self._internal_frag
+        return 1 - self.largest_free() / free if free > 0 else 0.0
+
+    def fit(self, req_size: int):
+        """Identificador del bloque libre que elige la política para `req_size`, o None."""
+        t0 = perf_counter_ns()
+        handle = self._fit(req_size)
+        stats = self.stats
+        stats["fit_ns"] += perf_counter_ns() - t0
+        stats["fits"] += 1
+        if handle is None:
+            stats["misses"] += 1
+        return handle
+    def allocate(self, handle: int, pid: int, req_size: int):
+        """Asigna `req_size` a `pid` en el bloque `handle`; devuelve el bloque ocupado.
+        El pedido tiene que entrar: no se recorta."""
+        t0 = perf_counter_ns()
+        block = self._allocate(handle, pid, req_size)
+        self.stats["alloc_ns"] += perf_counter_ns() - t0
+        self.stats["allocs"] += 1
+        self._used += block.occupied
+        self._internal_frag += block.size - block.occupied
+        return block
+    def free(self, handle: int):
+        t0 = perf_counter_ns()
+        size, occupied = self._free(handle)
+        self.stats["free_ns"] += perf_counter_ns() - t0
+        self.stats["frees"] += 1
+        self._used -= occupied
+        self._internal_frag -= size - occupied
+
+    def report(self):
+        """Métricas del asignador: operaciones, latencia media (ns) y fragmentación."""
+        s = self.stats
+        return {
+            "kind": self.kind, "fit": self.fit_policy,
+            "fits": s["fits"], "misses": s["misses"], "allocs": s["allocs"], "frees": s["frees"],
+            "mean_fit_ns": s["fit_ns"] / s["fits"] if s["fits"] else 0.0,
+            "mean_alloc_ns": s["alloc_ns"] / s["allocs"] if s["allocs"] else 0.0,
+            "mean_free_ns": s["free_ns"] / s["frees"] if s["frees"] else 0.0,
+            "compactions": s["compactions"], "moved": s["moved"],
+            "holes": sum(1 for b in self.partitions if b.is_free()),
+            "internal_fragmentation": self._internal_frag,
+            "external_fragmentation": self.external_fragmentation(),
+        }
+
+
+class Memory(_Allocator):
+    """Particiones fijas."""
+    kind = "fixed"
+    def __init__(self, partitions_sizes, fit="first"):
+        super().__init__(fit)
+        self.partitions = [MemoryPartition(s, i) for i, s in enumerate(partitions_sizes)]
+        # hojas = particiones: su tamaño si está libre, -1 si está ocupada o es relleno
+        self._tree = _MaxTree(len(self.partitions))
+        self._by_size = _SizeIndex()
+        for i, p in enumerate(self.partitions):
+            self._tree.t[self._tree.leaves + i] = p.size
+            self._by_size.add(p.size, i)
+        self._tree.build()
+        self._total = sum(p.size for p in self.partitions)
+        self._rover = 0
+    def config(self):
+        return {"partitions_sizes": [p.size for p in self.partitions], "kind": self.kind,
+                "fit": self.fit_policy, "compaction": False}
+    def largest_free(self):
+        """Tamaño de la mayor partición libre (0 si no hay ninguna)."""
+        return max(self._tree.max(), 0)
+    def first_fit(self, req_size: int):
+        """Primera partición libre (en orden) con tamaño >= req_size, o None."""
+        return self._tree.leftmost(req_size)
+    def _fit(self, req):
+        policy = self.fit_policy
+        if policy == "first":
+            return self._tree.leftmost(req)
+        if policy == "next":
+            idx = self._tree.leftmost(req, self._rover)
+            return self._tree.leftmost(req) if idx is None else idx
+        if policy == "best":
+            return self._by_size.best(req)
+        return self._by_size.worst(req)
+    def _allocate(self, idx, pid, req):
+        p = self.partitions[idx]
+        if req < 1 or not p.is_free() or req > p.size:
+            raise ValueError(f"el pedido {req} no entra en la partición {idx}")
+        p.owner_pid = pid
+        p.occupied = req
+        self._tree.set(idx, -1)
+        self._by_size.remove(p.size, idx)
+        self._rover = (idx + 1) % len(self.partitions)
+        self.dirty.add(idx)
+        return p
+    def _free(self, idx):
+        p = self.partitions[idx]
+        occupied = p.occupied
+        p.owner_pid = None
+        p.occupied = 0
+        self._tree.set(idx, p.size)
+        self._by_size.add(p.size, idx)
+        self.dirty.add(idx)
+        return p.size, occupied
+
+
+class _BlockMemory(_Allocator):
+    """Memoria de `total` unidades cubierta por bloques contiguos (ocupados y libres)."""
+    def __init__(self, total, fit="first"):
+        super().__init__(fit)
+        self._total = total
+        self._blocks = {}   # inicio -> bloque
+        self._starts = []   # inicios en orden de dirección
+        self._parts = []
+        self._parts_version = -1
+    def config(self):
+        return {"partitions_sizes": [self._total], "kind": self.kind,
+                "fit": self.fit_policy, "compaction": self.compaction}
+    @property
+    def partitions(self):
+        if self._parts_version != self.version:
+            self._parts = [self._blocks[s] for s in self._starts]
+            self._parts_version = self.version
+        return self._parts
+    def _add_block(self, start, size):
+        block = MemoryPartition(size, start)
+        self._blocks[start] = block
+        insort(self._starts, start)
+        return block
+    def _remove_block(self, start):
+        del self._blocks[start]
+        del self._starts[bisect_left(self._starts, start)]
+    def _block_at(self, addr):
+        """Bloque que contiene la dirección `addr`."""
+        i = bisect_right(self._starts, addr) - 1
+        if i < 0:
+            raise ValueError(f"dirección fuera de la memoria: {addr}")
+        return self._blocks[self._starts[i]]
+
+
+class DynamicMemory(_BlockMemory):
+    """Particionamiento dinámico con lista de huecos ordenada por dirección."""
+    kind = "dynamic"
+    def __init__(self, total, fit="first", compaction=False):
+        super().__init__(total, fit)
+        self._reset_holes()
+        if total > 0:
+            self._add_hole(0, total)
+        self.set_compaction(compaction)
+    def _reset_holes(self):
+        # hojas = direcciones: tamaño del hueco que empieza ahí, -1 si no empieza ninguno
+        self._tree = _MaxTree(self._total)
+        self._by_size = _SizeIndex()
+        self._rover = 0
+    def _add_hole(self, start, size):
+        self._add_block(start, size)
+        self._tree.set(start, size)
+        self._by_size.add(size, start)
+    def _remove_hole(self, start):
+        self._by_size.remove(self._blocks[start].size, start)
+        self._tree.set(start, -1)
+        self._remove_block(start)
+
+    def largest_free(self): return max(self._tree.max(), 0)
+    def _fit(self, req):
+        policy = self.fit_policy
+        if policy == "first":
+            return self._tree.leftmost(req)
+        if policy == "next":
+            addr = self._tree.leftmost(req, self._rover)
+            return self._tree.leftmost(req) if addr is None else addr
+        if policy == "best":
+            return self._by_size.best(req)
+        return self._by_size.worst(req)
+    def _allocate(self, addr, pid, req):
+        hole = self._block_at(addr)
+        start, size = hole.start, hole.size
+        if req < 1 or not hole.is_free() or addr + req > start + size:
+            raise ValueError(f"el pedido {req} no entra en el hueco de la dirección {addr}")
+        self._remove_hole(start)
+        if addr > start:
+            self._add_hole(start, addr - start)
+        block = self._add_block(addr, req)
+        block.owner_pid = pid
+        block.occupied = req
+        end = addr + req
+        if end < start + size:
+            self._add_hole(end, start + size - end)
+        self._rover = end if end < self._total else 0
+        self.version += 1
+        return block
+    def _free(self, addr):
+        block = self._blocks[addr]
+        size, occupied = block.size, block.occupied
+        self._remove_block(addr)
+        start, end = addr, addr + size
+        # fusión con los huecos vecinos
+        i = bisect_left(self._starts, addr) - 1
+        if i >= 0:
+            prev = self._blocks[self._starts[i]]
+            if prev.is_free() and prev.start + prev.size == start:
+                start = prev.start
+                self._remove_hole(start)
+        nxt = self._blocks.get(end)
+        if nxt is not None and nxt.is_free():
+            self._remove_hole(end)
+            end += nxt.size
+        self._add_hole(start, end - start)
+        self.version += 1
+        return size, occupied
+    def compact(self):
+        """Corre los bloques ocupados al principio, en orden, dejando un solo
+        hueco al final. Devuelve los bloques que cambiaron de dirección."""
+        owned = [b for b in self.partitions if not b.is_free()]
+        self._blocks, self._starts = {}, []
+        self._reset_holes()
+        moved, addr = [], 0
+        for old in owned:
+            block = self._add_block(addr, old.size)
+            block.owner_pid, block.occupied = old.owner_pid, old.occupied
+            if old.start != addr:
+                moved.append(block)
+            addr += old.size
+        if addr < self._total:
+            self._add_hole(addr, self._total - addr)
+        self.version += 1
+        self.stats["compactions"] += 1
+        self.stats["moved"] += len(moved)
+        return moved
+
+
+class BuddyMemory(_BlockMemory):
+    """Sistema buddy. Si `total` no es potencia de 2 se arranca con un bloque
+    por cada bit (64 + 32 + 4 para 100), alineados desde la dirección 0.
+    La política de ajuste no aplica: siempre se usa el menor bloque que alcance."""
+    kind = "buddy"
+    def __init__(self, total, fit="first"):
+        super().__init__(total, fit)
+        self._free_by_order = {}   # k -> inicios libres (ordenados) de bloques de 2**k
+        start = 0
+        for k in range(total.bit_length() - 1, -1, -1):
+            if total >> k & 1:
+                self._add_free(start, k)
+                start += 1 << k
+    def _add_free(self, start, k):
+        insort(self._free_by_order.setdefault(k, []), start)
+        self._add_block(start, 1 << k)
+    def _remove_free(self, start, k):
+        starts = self._free_by_order[k]
+        del starts[bisect_left(starts, start)]
+        if not starts:
+            del self._free_by_order[k]
+        self._remove_block(start)
+    @staticmethod
+    def order(req):
+        """Menor k con 2**k >= req."""
+        return max(req - 1, 0).bit_length()
+
+    def largest_free(self):
+        return 1 << max(self._free_by_order) if self._free_by_order else 0
+    def _fit(self, req):
+        need = self.order(req)
+        orders = [k for k in self._free_by_order if k >= need]
+        return self._free_by_order[min(orders)][0] if orders else None
+    def _allocate(self, addr, pid, req):
+        need = self.order(req)
+        block = self._block_at(addr)
+        start, k = block.start, block.size.bit_length() - 1
+        if (req < 1 or not block.is_free() or addr % (1 << need)
+                or addr + (1 << need) > start + block.size):
+            raise ValueError(f"el pedido {req} no entra en el bloque de la dirección {addr}")
+        self._remove_free(start, k)
+        # partir a la mitad hasta llegar al tamaño pedido, bajando hacia `addr`
+        while k > need:
+            k -= 1
+            half = start + (1 << k)
+            if addr >= half:
+                self._add_free(start, k)
+                start = half
+            else:
+                self._add_free(half, k)
+        block = self._add_block(start, 1 << need)
+        block.owner_pid = pid
+        block.occupied = req
+        self.version += 1
+        return block
+    def _free(self, addr):
+        block = self._blocks[addr]
+        size, occupied = block.size, block.occupied
+        self._remove_block(addr)
+        start, k = addr, size.bit_length() - 1
+        while True:
+            buddy = start ^ (1 << k)
+            starts = self._free_by_order.get(k)
+            if not starts:
+                break
+            i = bisect_left(starts, buddy)
+            if i == len(starts) or starts[i] != buddy:
+                break
+            self._remove_free(buddy, k)
+            start = min(start, buddy)
+            k += 1
+        self._add_free(start, k)
+        self.version += 1
+        return size, occupied
+
+
+def make_memory(partitions_sizes, kind="fixed", fit="first", compaction=False):
+    """Asignador `kind`; `dynamic` y `buddy` usan la suma de `partitions_sizes` como total."""
+    if kind == "fixed":
+        return Memory(partitions_sizes, fit)
+    if kind == "dynamic":
+        return DynamicMemory(sum(partitions_sizes), fit, compaction)
+    if kind == "buddy":
+        return BuddyMemory(sum(partitions_sizes), fit)
+    raise ValueError(f"tipo de memoria desconocido: {kind!r}")
@@ -0,0 +1,198 @@
+"""Métricas de una corrida: tiempo por fase de `Simulator.step`, contadores
+de planificación e histogramas por proceso.
+
+`Metrics.attach(sim)` la conecta en dos lugares: como `sim.profiler`, que
+hace que step() tome la hora entre fase y fase (`_step_profiled`), y como un
+receptor más de eventos (`add_recorder`), de donde salen los contadores y los
+histogramas. Sin nada conectado el simulador no mide nada: step() sólo
+pregunta si hay profiler.
+
+    fases        arrivals, admit, dispatch (temprano y tardío), running,
+                 blocked; fast_forward son los tramos salteados por run()
+    contadores   llegadas, admisiones, cambios de contexto (despachos),
+                 desalojos, bloqueos por I/O, despertares, fines, compactaciones
+    histogramas  espera en listos, respuesta (llegada -> primer despacho) y
+                 retorno (llegada -> fin), en ticks
+
+Los procesos que ya existían al conectar no entran en el histograma de
+respuesta (no se sabe si ya pasaron por la CPU).
+
+Exportación: `write_csv` (metric,labels,value) y `write_prometheus` (formato
+de texto de Prometheus). Ejemplo:
+    python simulador_so.py --headless --procs 200 --seed 1 --metrics-csv m.csv --metrics-prom m.prom
+"""
+import csv
+import math
+
+from simulador_so import (EV_ADMIT, EV_BLOCK, EV_COMPACT, EV_DISPATCH, EV_FINISH, EV_NEW,
+                          EV_PREEMPT, EV_WAKE, EVENT_KINDS)
+
+PHASES = ("arrivals", "admit", "dispatch", "running", "blocked", "fast_forward")
+
+# tipo de evento -> contador
+COUNTERS = {
+    EV_NEW: "arrivals", EV_ADMIT: "admissions", EV_DISPATCH: "context_switches",
+    EV_PREEMPT: "preemptions", EV_BLOCK: "io_blocks", EV_WAKE: "wakeups",
+    EV_FINISH: "finished", EV_COMPACT: "compactions",
+}
+
+
+class Histogram:
+    """Histograma de enteros >= 0 en cubetas de potencias de 2: la cubeta k
+    cuenta los valores con k bits, hasta 2**k - 1. Sumar es O(1)."""
+    def __init__(self, buckets=40):
+        self.counts = [0] * buckets
+        self.count = 0
+        self.sum = 0
+    def add(self, value):
+        self.counts[min(value.bit_length(), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.sum += value
+    def bounds(self):
+        """Límite superior (inclusive) de cada cubeta; la última no tiene."""
+        return [(1 << k) - 1 for k in range(len(self.counts) - 1)] + [math.inf]
+    def mean(self): return self.sum / self.count if self.count else 0.0
+    def quantile(self, q):
+        """Cota superior del cuantil `q` (el límite de la cubeta donde cae)."""
+        if not self.count:
+            return 0
+        target, acc = q * self.count, 0
+        for bound, n in zip(self.bounds(), self.counts):
+            acc += n
+            if acc >= target:
+                return bound
+        return math.inf
+
+
+class Metrics:
+    def __init__(self):
+        self.sim = None
+        self.phase_ns = dict.fromkeys(PHASES, 0)
+        self.steps = 0           # ticks dados con step()
+        self.skipped = 0         # ticks salteados por el fast-forward
+        self.counters = dict.fromkeys(COUNTERS.values(), 0)
+        self.wait = Histogram()
+        self.response = Histogram()
+        self.turnaround = Histogram()
+        self._arrival = {}       # pid -> tick de llegada, hasta su primer despacho
+
+    def attach(self, sim):
+        self.sim = sim
+        sim.profiler = self
+        sim.add_recorder(self)
+
+    def detach(self, sim):
+        if sim.profiler is self:
+            sim.profiler = None
+        sim.remove_recorder(self)
+        self.sim = None
+
+    # ---------- lado simulador ----------
+    def step_done(self, t0, t1, t2, t3, t4, t5, t6):
+        ns = self.phase_ns
+        ns["arrivals"] += t1 - t0
+        ns["admit"] += t2 - t1
+        ns["dispatch"] += t3 - t2 + t6 - t5
+        ns["running"] += t4 - t3
+        ns["blocked"] += t5 - t4
+        self.steps += 1
+
+    def fast_forward_done(self, t0, t1, skipped):
+        self.phase_ns["fast_forward"] += t1 - t0
+        self.skipped += skipped
+
+    def event(self, tick, kind, pid, a=0, b=0):
+        name = COUNTERS.get(kind)
+        if name is None:
+            return
+        self.counters[name] += 1
+        if kind == EV_NEW:
+            self._arrival[pid] = tick
+        elif kind == EV_DISPATCH:
+            arrival = self._arrival.pop(pid, None)
+            if arrival is not None:
+                self.response.add(tick - arrival)
+        elif kind == EV_FINISH:
+            # el proceso sigue en all_procs hasta después del evento
+            p = self.sim.all_procs[pid]
+            self.wait.add(p.wait_time)
+            self.turnaround.add(tick - p.arrival)
+
+    def tick_done(self, sim): pass
+    def checkpoint(self, sim): pass
+
+    # ---------- lectura ----------
+    def summary(self):
+        """Foto liviana para mostrar en vivo: contadores, µs medios por fase y
+        media / p50 / p95 de cada histograma."""
+        steps = self.steps or 1
+        return {
+            "steps": self.steps, "skipped": self.skipped,
+            "counters": dict(self.counters),
+            "phase_us": {ph: ns / steps / 1000 for ph, ns in self.phase_ns.items()
+                         if ph != "fast_forward"},
+            "fast_forward_ms": self.phase_ns["fast_forward"] / 1e6,
+            "histograms": {name: (h.mean(), h.quantile(0.5), h.quantile(0.95), h.count)
+                           for name, h in self._histograms()},
+        }
+
+    def _histograms(self):
+        return (("wait", self.wait), ("response", self.response), ("turnaround", self.turnaround))
+
+    def samples(self):
+        """(métrica, {etiquetas}, valor), en el orden en que se exportan."""
+        out = []
+        for ph, ns in self.phase_ns.items():
+            out.append(("simulador_phase_seconds_total", {"phase": ph}, ns / 1e9))
+        out.append(("simulador_ticks_total", {"mode": "step"}, self.steps))
+        out.append(("simulador_ticks_total", {"mode": "fast_forward"}, self.skipped))
+        for name, n in self.counters.items():
+            out.append((f"simulador_{name}_total", {}, n))
+        for name, h in self._histograms():
+            acc = 0
+            for bound, n in zip(h.bounds(), h.counts):
+                acc += n
+                le = "+Inf" if bound == math.inf else str(bound)
+                out.append((f"simulador_{name}_ticks_bucket", {"le": le}, acc))
+            out.append((f"simulador_{name}_ticks_sum", {}, h.sum))
+            out.append((f"simulador_{name}_ticks_count", {}, h.count))
+        return out
+
+
+HELP = {
+    "simulador_phase_seconds_total": ("counter", "Tiempo de pared por fase de step()."),
+    "simulador_ticks_total": ("counter", "Ticks simulados, dados con step() o salteados."),
+    "simulador_wait_ticks": ("histogram", "Ticks en la cola de listos por proceso terminado."),
+    "simulador_response_ticks": ("histogram", "Ticks desde la llegada hasta el primer despacho."),
+    "simulador_turnaround_ticks": ("histogram", "Ticks desde la llegada hasta el fin."),
+}
+HELP.update({f"simulador_{name}_total": ("counter", f"Eventos {EVENT_KINDS[kind]} del simulador.")
+             for kind, name in COUNTERS.items()})
+
+def _labels(labels):
+    return ",".join(f"{k}={v}" for k, v in labels.items())
+
+def write_csv(metrics, path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(("metric", "labels", "value"))
+        for name, labels, value in metrics.samples():
+            out.writerow((name, _labels(labels), value))
+
+def write_prometheus(metrics, path):
+    """Formato de texto de Prometheus (para el textfile collector de node_exporter)."""
+    lines, seen = [], set()
+    for name, labels, value in metrics.samples():
+        family = name
+        for suffix in ("_bucket", "_sum", "_count"):
+            if name.endswith(suffix) and name[:-len(suffix)] in HELP:
+                family = name[:-len(suffix)]
+        if family not in seen:
+            seen.add(family)
+            kind, text = HELP[family]
+            lines.append(f"# HELP {family} {text}")
+            lines.append(f"# TYPE {family} {kind}")
+        lab = ",".join(f'{k}="{v}"' for k, v in labels.items())
+        lines.append(f"{name}{{{lab}}} {value}" if lab else f"{name} {value}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
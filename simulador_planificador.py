@@ -0,0 +1,154 @@
+"""Planificadores de CPU: la cola de listos de `Simulator` con su política.
+
+Cada planificador guarda los procesos listos de su simulador y decide a
+quién despachar (`pop`), cuánto quantum darle (`time_slice`) y si el que
+corre debe dejar la CPU después de su tick (`preempt`). Encolar y despachar
+cuestan O(log n) o menos. `quiet_ticks` le dice a `Simulator._fast_forward`
+cuántos ticks puede correr el proceso en CPU sin que el planificador
+intervenga, suponiendo que la cola de listos no cambia.
+
+    rr        Round Robin (deque, quantum fijo)
+    sjf       el de menor CPU restante, sin desalojo (heap)
+    srtf      el de menor CPU restante, con desalojo (heap)
+    priority  el de mayor prioridad (0 = la más alta), con desalojo (heap)
+    mlfq      colas multinivel con realimentación
+"""
+import math
+from collections import deque
+from heapq import heappush, heappop
+
+
+class RoundRobin:
+    """FIFO; el que agota el quantum vuelve al final si hay otros listos."""
+    def __init__(self, sim):
+        self.sim = sim
+        self._q = deque()
+    def __len__(self): return len(self._q)
+    def __iter__(self): return iter(self._q)
+    def push(self, p): self._q.append(p)
+    def pop(self): return self._q.popleft()
+    def time_slice(self, p): return self.sim.quantum
+    def preempt(self, p):
+        return self.sim.quantum_left <= 0 and bool(self._q)
+    def quiet_ticks(self, p):
+        return max(self.sim.quantum_left, 1) - 1 if self._q else math.inf
+
+
+class _HeapScheduler:
+    """Heap de (clave, orden de llegada, proceso); a igual clave, FIFO.
+    La clave se calcula al encolar y no cambia mientras el proceso espera."""
+    preemptive = False
+    def __init__(self, sim):
+        self.sim = sim
+        self._heap = []
+        self._seq = 0
+    def __len__(self): return len(self._heap)
+    def __iter__(self): return (entry[-1] for entry in self._heap)
+    def key(self, p): raise NotImplementedError
+    def push(self, p):
+        heappush(self._heap, (self.key(p), self._seq, p))
+        self._seq += 1
+    def pop(self): return heappop(self._heap)[-1]
+    def time_slice(self, p): return math.inf
+    def preempt(self, p):
+        return self.preemptive and bool(self._heap) and self._heap[0][0] < self.key(p)
+    def quiet_ticks(self, p):
+        # la clave del que corre no empeora mientras corre
+        return 0 if self.preempt(p) else math.inf
+
+class ShortestJobFirst(_HeapScheduler):
+    def key(self, p): return p.cpu_remaining
+
+class ShortestRemainingTime(ShortestJobFirst):
+    preemptive = True
+    def quiet_ticks(self, p):
+        # el que corre baja uno por tick: si no lo desaloja el primer listo en
+        # el próximo chequeo (después del tick), ya no lo hará
+        if self._heap and self._heap[0][0] < p.cpu_remaining - 1:
+            return 0
+        return math.inf
+
+class PriorityScheduler(_HeapScheduler):
+    preemptive = True
+    def key(self, p): return p.priority
+
+
+class MultiLevelFeedback:
+    """`levels` colas FIFO; el nivel k tiene quantum `quantum * 2**k`. Quien agota
+    su quantum baja un nivel; quien se bloquea antes conserva el suyo. Un listo
+    de un nivel más alto desaloja al que corre. Cada `boost_every` ticks todos
+    vuelven al nivel 0 (contra la inanición); se aplica al tomar la próxima
+    decisión, comparando la época (tick // boost_every) de cada proceso."""
+    def __init__(self, sim, levels=3, boost_every=200):
+        self.sim = sim
+        self.levels = levels
+        self.boost_every = boost_every
+        self._qs = [deque() for _ in range(levels)]
+        self._n = 0
+        self._epoch = sim.tick // boost_every   # época del último boost aplicado a las colas
+    def __len__(self): return self._n
+    def __iter__(self): return (p for q in self._qs for p in q)
+
+    def _level(self, p):
+        epoch = self.sim.tick // self.boost_every
+        if p.level_epoch < epoch:
+            p.level, p.level_epoch = 0, epoch
+        return p.level
+    def _boost(self):
+        # toda operación pasa primero por acá, así el boost cae siempre entre
+        # las mismas operaciones, se avance tick a tick o de a tramos
+        epoch = self.sim.tick // self.boost_every
+        if epoch > self._epoch:
+            self._epoch = epoch
+            top = self._qs[0]
+            for q in self._qs[1:]:
+                top.extend(q)
+                q.clear()
+            for p in top:
+                p.level, p.level_epoch = 0, epoch
+
+    def push(self, p):
+        self._boost()
+        self._qs[min(self._level(p), self.levels - 1)].append(p)
+        self._n += 1
+    def pop(self):
+        self._boost()
+        for q in self._qs:
+            if q:
+                self._n -= 1
+                return q.popleft()
+        raise IndexError("pop de una cola vacía")
+    def _top_level(self):
+        return next(i for i, q in enumerate(self._qs) if q)
+    def time_slice(self, p):
+        return self.sim.quantum << self._level(p)
+    def preempt(self, p):
+        self._boost()
+        level = self._level(p)
+        if self.sim.quantum_left <= 0:
+            p.level = min(level + 1, self.levels - 1)
+            if self._n:
+                return True
+            self.sim.quantum_left = self.time_slice(p)
+            return False
+        return bool(self._n) and self._top_level() < level
+    def quiet_ticks(self, p):
+        self._boost()
+        if self._n and self._top_level() < self._level(p):
+            return 0
+        return max(self.sim.quantum_left, 1) - 1
+
+
+SCHEDULERS = {
+    "rr": RoundRobin,
+    "sjf": ShortestJobFirst,
+    "srtf": ShortestRemainingTime,
+    "priority": PriorityScheduler,
+    "mlfq": MultiLevelFeedback,
+}
+
+def make_scheduler(name, sim):
+    try:
+        return SCHEDULERS[name](sim)
+    except KeyError:
+        raise ValueError(f"planificador desconocido: {name!r}") from None
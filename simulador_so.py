@@ -1,8 +1,18 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
+import argparse
+import math
+import random
+import sys
 from enum import Enum
-from random import randrange, choice
+from random import Random
 from collections import deque
+from heapq import heappush, heappop, merge
+from bisect import bisect_right, insort
+from array import array
+from time import perf_counter_ns
+
+from simulador_memoria import (FIT_POLICIES, MEMORY_KINDS, Memory, MemoryPartition,
+                               make_memory)
+from simulador_planificador import SCHEDULERS, make_scheduler
 
 # ============================
 #   MODELO
@@ -14,112 +24,562 @@ class ProcState(Enum):
     BLOCKED = "Bloqueado"
     TERMINATED = "Terminado"
 
-class MemoryPartition:
-    def __init__(self, size: int):
-        self.size = size
-        self.owner_pid = None
-        self.occupied = 0
-    def is_free(self):
-        return self.owner_pid is None
-
-class Memory:
-    def __init__(self, partitions_sizes):
-        self.partitions = [MemoryPartition(s) for s in partitions_sizes]
-    def total_size(self): return sum(p.size for p in self.partitions)
-    def used_size(self):  return sum(p.occupied for p in self.partitions)
-    def free_size(self):  return self.total_size() - self.used_size()
-    def first_fit(self, req_size: int):
-        for i, p in enumerate(self.partitions):
-            if p.is_free() and p.size >= req_size:
-                return i
-        return None
-    def allocate(self, idx: int, pid: int, req_size: int):
-        p = self.partitions[idx]
-        p.owner_pid = pid
-        p.occupied  = min(req_size, p.size)
-    def free(self, idx: int):
-        p = self.partitions[idx]
-        p.owner_pid = None
-        p.occupied  = 0
+ADMISSION_POLICIES = ("fifo", "first", "best")
+
+# Eventos que el simulador informa a `Simulator.recorder` como
+# (tick, tipo, pid, a, b); ver simulador_traza.py.
+#   NEW      a=memoria pedida, b=CPU      ALLOC  a=bloque (su inicio), b=ocupado
+#   ADMIT    -                            FREE   a=bloque
+#   DISPATCH a=CPU restante, b=1 si fue después del tick de CPU
+#   PREEMPT  a=CPU restante               BLOCK  a=tick de despertar, b=CPU restante
+#   WAKE     -                            FINISH -
+#   COMPACT  pid=-1, a=bloques movidos (la memoria dinámica se compactó)
+EVENT_KINDS = ("NEW", "ADMIT", "DISPATCH", "PREEMPT", "BLOCK", "WAKE", "FINISH", "ALLOC", "FREE",
+               "COMPACT")
+(EV_NEW, EV_ADMIT, EV_DISPATCH, EV_PREEMPT, EV_BLOCK,
+ EV_WAKE, EV_FINISH, EV_ALLOC, EV_FREE, EV_COMPACT) = range(len(EVENT_KINDS))
+
+class RecorderGroup:
+    """Varios receptores de eventos colgados a la vez (traza, métricas...)."""
+    def __init__(self, members):
+        self.members = list(members)
+    def event(self, tick, kind, pid, a=0, b=0):
+        for m in self.members:
+            m.event(tick, kind, pid, a, b)
+    def tick_done(self, sim):
+        for m in self.members:
+            m.tick_done(sim)
+    def checkpoint(self, sim):
+        for m in self.members:
+            m.checkpoint(sim)
+
+class WaitQueue:
+    """Cola de espera de memoria indexada por tamaño pedido.
+
+    Cada tamaño distinto es una clase con su propia deque FIFO; `_sizes`
+    guarda las clases presentes ordenadas. Además, un árbol de segmentos
+    sobre los tamaños (ralo: un dict de nodos, sólo los que tienen algo)
+    guarda en cada hoja el (número de llegada, tamaño) del más antiguo de
+    la clase. Dada la mayor partición libre, el candidato de cada política
+    sale sin recorrer la cola:
+      - "fifo":  el más antiguo de todos (la raíz), sólo si entra.
+      - "first": el más antiguo de los que entran, mínimo de un prefijo del árbol.
+      - "best":  el de mayor pedido que entra (el más antiguo de esa clase).
+    """
+    _EMPTY = (math.inf, 0)
+    def __init__(self, procs=()):
+        self._seq = 0
+        self._by_size = {}         # tamaño -> deque[(seq, proceso)]
+        self._sizes = []           # tamaños presentes, ordenados
+        self._leaves = 1           # el árbol cubre los tamaños [0, _leaves)
+        self._tree = {}            # nodo -> (seq, tamaño) mínimo del rango
+        self._n = 0
+        for p in procs:
+            self.append(p)
+    def __len__(self): return self._n
+    def __iter__(self):
+        return (p for seq, p in merge(*self._by_size.values()))
+    def _update(self, size):
+        """Vuelve a calcular la hoja de `size` y sus ancestros."""
+        if size >= self._leaves:
+            # agrandar el dominio: se rearma con las clases presentes
+            while size >= self._leaves:
+                self._leaves *= 2
+            self._tree = {}
+            for other in self._sizes:
+                if other != size:
+                    self._update(other)
+        t, empty = self._tree, self._EMPTY
+        node = self._leaves + size
+        bucket = self._by_size.get(size)
+        value = (bucket[0][0], size) if bucket else empty
+        while node:
+            if t.get(node, empty) == value:
+                break   # de acá para arriba no cambia nada
+            if value is empty:
+                del t[node]
+            else:
+                t[node] = value
+            node //= 2
+            value = min(t.get(2*node, empty), t.get(2*node + 1, empty))
+    def _oldest(self, n):
+        """(seq, tamaño) del más antiguo con tamaño < `n`."""
+        t, best = self._tree, self._EMPTY
+        lo, hi = self._leaves, self._leaves + min(n, self._leaves)
+        while lo < hi:
+            if lo & 1:
+                best = min(best, t.get(lo, best)); lo += 1
+            if hi & 1:
+                hi -= 1; best = min(best, t.get(hi, best))
+            lo //= 2; hi //= 2
+        return best
+    def append(self, p):
+        seq = self._seq; self._seq += 1
+        p.wait_seq = seq
+        size = p.mem_required
+        bucket = self._by_size.get(size)
+        if bucket is None:
+            bucket = self._by_size[size] = deque()
+            insort(self._sizes, size)
+        bucket.append((seq, p))
+        if len(bucket) == 1:
+            self._update(size)
+        self._n += 1
+    def head(self):
+        if not self._n:
+            return None
+        return self._by_size[self._tree[1][1]][0][1]
+    def candidate(self, max_size: int, policy="fifo"):
+        """Proceso a admitir si la mayor partición libre mide `max_size`, o None."""
+        if not self._n:
+            return None
+        if policy == "fifo":
+            p = self.head()
+            return p if p.mem_required <= max_size else None
+        if policy == "best":
+            fits = bisect_right(self._sizes, max_size)
+            return self._by_size[self._sizes[fits - 1]][0][1] if fits else None
+        # "first": el de menor número de llegada entre las clases que entran
+        seq, size = self._oldest(max_size + 1)
+        return self._by_size[size][0][1] if seq != math.inf else None
+    def remove(self, p):
+        """Saca a `p`, que debe ser el más antiguo de su clase de tamaño."""
+        size = p.mem_required
+        bucket = self._by_size[size]
+        bucket.popleft()
+        if not bucket:
+            del self._by_size[size]
+            self._sizes.pop(bisect_right(self._sizes, size) - 1)
+        self._update(size)
+        p.wait_seq = None
+        self._n -= 1
+
+class RandomStream:
+    """Sub-stream de azar con su propio generador. Los enteros uniformes se
+    sortean por tandas de BATCH y se consumen de a uno; cambiar el rango
+    descarta lo que quedaba de la tanda anterior."""
+    BATCH = 256
+    def __init__(self, seed=None):
+        self.rng = Random(seed)
+        self._buf = []
+        self._range = None
+    def randint(self, lo: int, hi: int):
+        """Entero uniforme en [lo, hi], como random.randint."""
+        if not self._buf or self._range != (lo, hi):
+            self._buf = self.rng.choices(range(lo, hi + 1), k=self.BATCH)
+            self._range = (lo, hi)
+        return self._buf.pop()
+    def geometric(self, prob: float):
+        """Cantidad de ensayos de Bernoulli(prob) hasta el primer éxito, inclusive
+        (infinito si prob <= 0)."""
+        if prob >= 1:
+            return 1
+        if prob <= 0:
+            return math.inf
+        return int(math.log(1.0 - self.rng.random()) / math.log(1.0 - prob)) + 1
+
+def substream(seed, name):
+    """Sub-stream `name` derivado de `seed`: cada uno es reproducible por su
+    cuenta, así que sortear más en uno no corre los valores de los otros."""
+    return RandomStream(None if seed is None else f"{seed}/{name}")
+
+
+PRIORITY_RANGE = (0, 4)   # prioridades sorteadas cuando no se indican (0 = la más alta)
+
+PROCESS_COLORS = ("#6aa84f","#3c78d8","#e69138","#a64d79",
+                  "#76a5af","#674ea7","#cc0000","#3d85c6")
 
 class Process:
+    __slots__ = ("pid", "mem_required", "mem_index", "state", "cpu_remaining", "cpu_burst",
+                 "wake_tick", "wait_seq", "arrival", "ready_since", "wait_time", "io_pattern",
+                 "priority", "level", "level_epoch")
     _next_pid = 100
-    def __init__(self, mem_req_range=(1, 12), cpu_time_range=(20, 60)):
+    def __init__(self, mem_req_range=(1, 12), cpu_time_range=(20, 60), rng=random, arrival=0,
+                 burst_rng=None, mem_required=None, cpu_time=None, io_pattern=None, priority=0):
         self.pid = Process._next_pid; Process._next_pid += 1
-        self.mem_required = randrange(mem_req_range[0], mem_req_range[1] + 1)
+        self.mem_required = rng.randint(*mem_req_range) if mem_required is None else mem_required
         self.mem_index = -1
         self.state = ProcState.BLOCKED
-        self.cpu_remaining = randrange(cpu_time_range[0], cpu_time_range[1] + 1)
-        self.io_remaining  = 0
-        self.color = choice(["#6aa84f","#3c78d8","#e69138","#a64d79",
-                             "#76a5af","#674ea7","#cc0000","#3d85c6"])
+        self.cpu_remaining = (burst_rng or rng).randint(*cpu_time_range) if cpu_time is None else cpu_time
+        self.cpu_burst = self.cpu_remaining
+        self.wake_tick = 0   # tick en el que termina su I/O (si está bloqueado)
+        self.wait_seq = None # orden de llegada en la espera de memoria
+        self.arrival = arrival
+        self.ready_since = arrival
+        self.wait_time = 0   # ticks acumulados en la cola de listos
+        # duraciones de sus próximos I/O, al revés (se consumen con pop); None = sorteadas
+        self.io_pattern = list(reversed(io_pattern)) if io_pattern else None
+        self.priority = priority   # 0 = la más alta (planificador "priority")
+        self.level = 0             # nivel en la MLFQ y época en que se le asignó
+        self.level_epoch = 0
+    @property
+    def color(self):
+        return PROCESS_COLORS[self.pid % len(PROCESS_COLORS)]
+
+class TerminatedStore:
+    """Resumen compacto de los procesos terminados: una columna `array` por
+    campo, con lo que necesitan las métricas (ya no se guarda el Process).
+    Con `keep_rows=False` sólo se acumulan los totales, en memoria constante."""
+    FIELDS = ("pid", "arrival", "finish", "wait_time", "cpu_burst", "mem_required")
+    def __init__(self, keep_rows=True):
+        for f in self.FIELDS:
+            setattr(self, f, array("q"))
+        self.keep_rows = keep_rows
+        self.count = 0
+        self.total_turnaround = 0
+        self.total_wait = 0
+    def __len__(self): return self.count
+    def append(self, p: Process, finish: int):
+        self.count += 1
+        self.total_turnaround += finish - p.arrival
+        self.total_wait += p.wait_time
+        if not self.keep_rows:
+            return
+        self.pid.append(p.pid)
+        self.arrival.append(p.arrival)
+        self.finish.append(finish)
+        self.wait_time.append(p.wait_time)
+        self.cpu_burst.append(p.cpu_burst)
+        self.mem_required.append(p.mem_required)
+    def rows(self):
+        """Tuplas (pid, arrival, finish, wait_time, cpu_burst, mem_required)."""
+        return zip(*(getattr(self, f) for f in self.FIELDS))
+    def mean_turnaround(self):
+        return self.total_turnaround / len(self) if len(self) else 0.0
+    def mean_wait(self):
+        return self.total_wait / len(self) if len(self) else 0.0
 
 class Simulator:
-    """Round Robin + memoria con particiones fijas (first-fit)."""
+    """Planificador de CPU intercambiable (Round Robin por defecto, ver
+    simulador_planificador.py) + asignador de memoria intercambiable
+    (particiones fijas con first-fit por defecto, ver simulador_memoria.py)."""
     def __init__(self, partitions_sizes=None, quantum=5,
-                 cpu_time_range=(20, 60), prob_block=20, io_time_range=(3,8)):
+                 cpu_time_range=(20, 60), prob_block=20, io_time_range=(3,8),
+                 seed=None, admission="fifo", scheduler="rr",
+                 memory="fixed", fit="first", compaction=False):
         if partitions_sizes is None:
             partitions_sizes = [2,2,4,6,6,8,8,12,16]
-        self.mem = Memory(partitions_sizes)
-        self.all_procs: list[Process] = []
-        self.wait_mem = deque()
-        self.ready    = deque()
+        # `dynamic` y `buddy` usan la suma de las particiones como memoria total
+        self.partitions_sizes = list(partitions_sizes)
+        self.mem = make_memory(self.partitions_sizes, memory, fit, compaction)
+        self.all_procs: dict[int, Process] = {}   # procesos vivos por PID
+        self.terminated = TerminatedStore()
+        self.wait_mem = WaitQueue()
+        # bloqueados por I/O: heap de (tick de despertar, orden de llegada, proceso)
         self.blocked  = []
+        self._blocked_seq = 0
         self.running: Process | None = None
+        self.tick = 0
+        # procesos por estado, actualizado en cada transición (_set_state)
+        self.state_counts = {st: 0 for st in ProcState}
+        # PIDs con transiciones desde el último take_changes(); None = sin seguimiento
+        self.dirty_pids = None
+        # quien recibe los eventos (p.ej. simulador_traza.TraceRecorder); None = nadie.
+        # Con más de uno es un RecorderGroup: ver add_recorder / remove_recorder
+        self.recorder = None
+        # mide el tiempo de cada fase de step() (simulador_metricas.Metrics); None = no se mide
+        self.profiler = None
+        # llegadas programadas (set_workload): iterador, próximo trabajo y su tick absoluto
+        self._workload = None
+        self._next_job = None
+        self._next_arrival = None
+        self._workload_base = 0
+        # error de la carga (trabajo mal formado o fuera de orden): la carga se
+        # desconecta y el error queda acá para quien corre la simulación
+        self.workload_error = None
 
         self.quantum = max(1, int(quantum))
         self.quantum_left = self.quantum
         self.cpu_time_range = cpu_time_range
         self.prob_block = prob_block
         self.io_time_range = io_time_range
-
-    def add_process(self):
-        p = Process(cpu_time_range=self.cpu_time_range)
-        self.all_procs.append(p)
-        idx = self.mem.first_fit(p.mem_required)
-        if idx is not None:
-            self.mem.allocate(idx, p.pid, p.mem_required)
-            p.mem_index = idx
-            p.state = ProcState.READY
-            self.ready.append(p)
+        if admission not in ADMISSION_POLICIES:
+            raise ValueError(f"política de admisión desconocida: {admission!r}")
+        self.admission = admission
+        # cola de listos: la arma el planificador elegido
+        self.ready = make_scheduler(scheduler, self)
+        self.scheduler = scheduler
+        # Todo el azar de la simulación sale de estos sub-streams: misma semilla,
+        # misma corrida. Cada uno tiene su propio generador, así que cambiar,
+        # p.ej., la probabilidad de bloqueo no altera las ráfagas sorteadas.
+        self.arrival_rng = substream(seed, "arrivals")   # memoria pedida
+        self.burst_rng   = substream(seed, "bursts")     # CPU
+        self.block_rng   = substream(seed, "blocking")
+        self.io_rng      = substream(seed, "io")
+        self.priority_rng = substream(seed, "priority")
+        # chequeos de bloqueo (uno por tick de CPU que no termina) que faltan
+        # hasta el que bloquea: geométrica, igual que sortear prob_block cada tick
+        self._block_gap = self.block_rng.geometric(prob_block / 100)
+
+    def _set_state(self, p: Process, state: ProcState):
+        if self.dirty_pids is not None:
+            self.dirty_pids.add(p.pid)
+        self.state_counts[p.state] -= 1
+        self.state_counts[state] += 1
+        if state == ProcState.READY:
+            p.ready_since = self.tick
+        elif p.state == ProcState.READY:
+            p.wait_time += self.tick - p.ready_since
+        p.state = state
+
+    def add_process(self, mem_required=None, cpu_time=None, io_pattern=None, priority=None):
+        """Agrega un proceso; lo que no se indica se sortea con los rangos vigentes."""
+        if priority is None:
+            priority = self.priority_rng.randint(*PRIORITY_RANGE)
+        p = Process(cpu_time_range=self.cpu_time_range, rng=self.arrival_rng,
+                    burst_rng=self.burst_rng, arrival=self.tick, mem_required=mem_required,
+                    cpu_time=cpu_time, io_pattern=io_pattern, priority=priority)
+        self.all_procs[p.pid] = p
+        self.state_counts[p.state] += 1
+        rec = self.recorder
+        if rec is not None:
+            rec.event(self.tick, EV_NEW, p.pid, p.mem_required, p.cpu_remaining)
+        handle = self.mem.fit(p.mem_required)
+        if handle is not None:
+            self._admit(p, handle)
         else:
-            p.state = ProcState.BLOCKED
+            self._set_state(p, ProcState.BLOCKED)
             self.wait_mem.append(p)
 
+    def set_workload(self, jobs):
+        """Programa llegadas desde `jobs`: un iterable de trabajos con `arrival`
+        (ticks contados desde ahora), `mem`, `cpu` e `io` (duraciones de sus I/O
+        o None), ordenado por llegada. Se lee de a un trabajo a medida que llega
+        su tick, así que puede ser un generador sobre un archivo enorme."""
+        self._workload = iter(jobs)
+        self._workload_base = self.tick
+        self._next_arrival = None
+        self._pull_job()
+
+    def _pull_job(self):
+        """Lee el próximo trabajo. Si la carga está mal formada o desordenada
+        se desconecta y el error queda en `workload_error`; el tick en curso
+        sigue normalmente."""
+        try:
+            job = next(self._workload, None)
+            if job is not None:
+                arrival = self._workload_base + job.arrival
+                if self._next_arrival is not None and arrival < self._next_arrival:
+                    raise ValueError(f"la carga no está ordenada por llegada (tick {job.arrival})")
+        except (OSError, ValueError) as e:
+            self.workload_error = e
+            job = None
+        if job is None:
+            self._workload = self._next_job = self._next_arrival = None
+            return
+        self._next_job, self._next_arrival = job, arrival
+
+    def _arrivals(self):
+        while self._next_arrival is not None and self._next_arrival <= self.tick:
+            job = self._next_job
+            self.add_process(job.mem, job.cpu, job.io, job.priority)
+            self._pull_job()
+
+    def configure(self, quantum=None, cpu_time_range=None, prob_block=None,
+                  io_time_range=None, admission=None, reassign_cpu=False,
+                  partitions_sizes=None, scheduler=None, memory=None, fit=None,
+                  compaction=None):
+        """Cambia parámetros en caliente (lo que aplica el diálogo de Ajustes).
+        `reassign_cpu` sortea de nuevo la CPU restante de los procesos vivos con
+        el rango vigente; `partitions_sizes` o un `memory` distinto reinician la
+        memoria (reset_memory); `fit` y `compaction` rigen desde la próxima
+        asignación; `scheduler` pasa los listos, en su orden actual, al nuevo
+        planificador."""
+        if quantum is not None:
+            self.quantum = max(1, int(quantum))
+        if cpu_time_range is not None:
+            self.cpu_time_range = tuple(cpu_time_range)
+        if prob_block is not None and prob_block != self.prob_block:
+            self.prob_block = prob_block
+            # sin memoria: se puede volver a sortear el hueco con la nueva probabilidad
+            self._block_gap = self.block_rng.geometric(prob_block / 100)
+        if io_time_range is not None:
+            self.io_time_range = tuple(io_time_range)
+        if admission is not None:
+            if admission not in ADMISSION_POLICIES:
+                raise ValueError(f"política de admisión desconocida: {admission!r}")
+            self.admission = admission
+        if scheduler is not None and scheduler != self.scheduler:
+            self._rebuild_ready(scheduler)
+            if self.running is not None:
+                self.quantum_left = self.ready.time_slice(self.running)
+        if reassign_cpu:
+            lo, hi = self.cpu_time_range
+            for p in self.all_procs.values():
+                p.cpu_remaining = max(1, self.burst_rng.randint(lo, hi))
+            self._rebuild_ready(self.scheduler)   # las claves por CPU cambiaron
+            if self.recorder is not None:
+                self.recorder.checkpoint(self)
+        if partitions_sizes is not None or (memory is not None and memory != self.mem.kind):
+            self.reset_memory(partitions_sizes, memory, fit, compaction)
+        else:
+            if fit is not None:
+                self.mem.set_fit(fit)
+            if compaction is not None:
+                self.mem.set_compaction(compaction)
+
+    def _rebuild_ready(self, scheduler):
+        old, self.ready = self.ready, make_scheduler(scheduler, self)
+        self.scheduler = scheduler
+        while old:
+            self.ready.push(old.pop())
+
+    def reset_memory(self, partitions_sizes=None, memory=None, fit=None, compaction=None):
+        """Reemplaza la memoria; lo que no se indica (particiones, tipo, ajuste,
+        compactación) se toma de la actual. Los procesos vivos vuelven a la
+        espera de memoria."""
+        if partitions_sizes is not None:
+            self.partitions_sizes = list(partitions_sizes)
+        old = self.mem
+        self.mem = make_memory(self.partitions_sizes, memory or old.kind, fit or old.fit_policy,
+                               old.compaction if compaction is None else compaction)
+        live = list(self.all_procs.values())
+        for p in live:
+            self._set_state(p, ProcState.BLOCKED)
+            p.mem_index = -1
+            p.wake_tick = 0
+        self.wait_mem = WaitQueue(live)
+        self.ready = make_scheduler(self.scheduler, self)
+        self.blocked = []
+        self.running = None
+        if self.recorder is not None:
+            self.recorder.checkpoint(self)
+
+    def add_recorder(self, rec):
+        """Suma un receptor de eventos a los que ya estén colgados."""
+        if self.recorder is None:
+            self.recorder = rec
+        elif isinstance(self.recorder, RecorderGroup):
+            self.recorder.members.append(rec)
+        else:
+            self.recorder = RecorderGroup([self.recorder, rec])
+
+    def remove_recorder(self, rec):
+        if self.recorder is rec:
+            self.recorder = None
+        elif isinstance(self.recorder, RecorderGroup) and rec in self.recorder.members:
+            members = self.recorder.members
+            members.remove(rec)
+            if len(members) == 1:
+                self.recorder = members[0]
+
+    def enable_change_tracking(self):
+        """Empieza a anotar qué procesos cambian, para quien renderiza por diferencias."""
+        if self.dirty_pids is None:
+            self.dirty_pids = set()
+
+    def take_changes(self):
+        """Devuelve (PIDs, particiones) cambiados desde la llamada anterior y los olvida.
+
+        Un proceso cambia de estado, partición o CPU restante sólo a través de
+        una transición, salvo mientras está en CPU (su CPU baja cada tick) o
+        bloqueado por I/O (su I/O restante baja cada tick): esos se consultan
+        aparte con `running` y `io_blocked()`. Tras reset_memory cambia `mem`
+        y hay que redibujar todas las particiones; en la memoria dinámica y la
+        buddy los bloques cambian de forma, y lo avisa `mem.version`."""
+        pids = self.dirty_pids if self.dirty_pids is not None else set()
+        parts = self.mem.dirty
+        if self.dirty_pids is not None:
+            self.dirty_pids = set()
+        self.mem.dirty = set()
+        return pids, parts
+
+    def io_blocked(self):
+        """Procesos bloqueados por I/O (en orden de despertar no garantizado)."""
+        return [p for wake, _, p in self.blocked
+                if p.state == ProcState.BLOCKED and p.wake_tick == wake]
+
+    def _can_admit(self):
+        """Hay un proceso en espera que entra ya, o que entraría compactando."""
+        mem = self.mem
+        if self.wait_mem.candidate(mem.largest_free(), self.admission) is not None:
+            return True
+        return (mem.compaction and mem.free_size() > mem.largest_free()
+                and self.wait_mem.candidate(mem.free_size(), self.admission) is not None)
+
     def _try_admit_from_waiting(self):
-        changed = True
-        while changed and self.wait_mem:
-            changed = False
-            p = self.wait_mem[0]
-            idx = self.mem.first_fit(p.mem_required)
-            if idx is not None:
-                self.mem.allocate(idx, p.pid, p.mem_required)
-                p.mem_index = idx
-                p.state = ProcState.READY
-                self.ready.append(p)
-                self.wait_mem.popleft()
-                changed = True
-
-    def _dispatch_if_needed(self):
+        while self.wait_mem:
+            p = self.wait_mem.candidate(self.mem.largest_free(), self.admission)
+            if p is None:
+                if not self._can_admit():
+                    break
+                self._compact()
+                continue
+            self.wait_mem.remove(p)
+            self._admit(p, self.mem.fit(p.mem_required))
+
+    def _compact(self):
+        moved = self.mem.compact()
+        for block in moved:
+            self.all_procs[block.owner_pid].mem_index = block.start
+            if self.dirty_pids is not None:
+                self.dirty_pids.add(block.owner_pid)
+        if self.recorder is not None:
+            self.recorder.event(self.tick, EV_COMPACT, -1, len(moved))
+
+    def _admit(self, p: Process, handle: int):
+        block = self.mem.allocate(handle, p.pid, p.mem_required)
+        p.mem_index = block.start
+        self._set_state(p, ProcState.READY)
+        self.ready.push(p)
+        rec = self.recorder
+        if rec is not None:
+            rec.event(self.tick, EV_ALLOC, p.pid, block.start, block.occupied)
+            rec.event(self.tick, EV_ADMIT, p.pid)
+
+    def _dispatch_if_needed(self, late=False):
         if self.running is None and self.ready:
-            self.running = self.ready.popleft()
-            self.running.state = ProcState.RUNNING
-            self.quantum_left = self.quantum
+            self.running = self.ready.pop()
+            self._set_state(self.running, ProcState.RUNNING)
+            self.quantum_left = self.ready.time_slice(self.running)
+            rec = self.recorder
+            if rec is not None:
+                rec.event(self.tick, EV_DISPATCH, self.running.pid, self.running.cpu_remaining, late)
 
     def _preempt(self):
-        runnable = len(self.ready) + (1 if self.running else 0)
-        if self.running and self.quantum_left <= 0 and runnable > 1:
-            self.running.state = ProcState.READY
-            self.ready.append(self.running)
+        if self.running and self.ready.preempt(self.running):
+            rec = self.recorder
+            if rec is not None:
+                rec.event(self.tick, EV_PREEMPT, self.running.pid, self.running.cpu_remaining)
+            self._set_state(self.running, ProcState.READY)
+            self.ready.push(self.running)
             self.running = None
 
     def _finish_process(self, p: Process):
-        p.state = ProcState.TERMINATED
+        self._set_state(p, ProcState.TERMINATED)
+        rec = self.recorder
+        if rec is not None:
+            rec.event(self.tick, EV_FINISH, p.pid)
         if p.mem_index >= 0:
+            if rec is not None:
+                rec.event(self.tick, EV_FREE, p.pid, p.mem_index)
             self.mem.free(p.mem_index)
             p.mem_index = -1
+        del self.all_procs[p.pid]
+        self.terminated.append(p, self.tick)
         self._try_admit_from_waiting()
 
+    def _block_running(self, p: Process):
+        self._set_state(p, ProcState.BLOCKED)
+        if p.io_pattern:
+            io = p.io_pattern.pop()
+        else:
+            io = self.io_rng.randint(*self.io_time_range)
+        # el tick del bloqueo ya cuenta como primer tick de I/O
+        p.wake_tick = self.tick + max(io, 1) - 1
+        heappush(self.blocked, (p.wake_tick, self._blocked_seq, p))
+        self._blocked_seq += 1
+        self.running = None
+        rec = self.recorder
+        if rec is not None:
+            rec.event(self.tick, EV_BLOCK, p.pid, p.wake_tick, p.cpu_remaining)
+
+    def io_remaining(self, p: Process):
+        """Ticks de I/O que le quedan a `p` (0 si no está bloqueado por I/O)."""
+        if p.state != ProcState.BLOCKED:
+            return 0
+        return max(0, p.wake_tick - self.tick)
+
     def _tick_running(self):
         if not self.running: return
         p = self.running
@@ -129,343 +589,244 @@ class Simulator:
             self._finish_process(p)
             self.running = None
             return
-        if randrange(100) < self.prob_block:
-            p.state = ProcState.BLOCKED
-            p.io_remaining = randrange(self.io_time_range[0], self.io_time_range[1] + 1)
-            self.blocked.append(p)
-            self.running = None
+        self._block_gap -= 1
+        if self._block_gap <= 0:
+            self._block_gap = self.block_rng.geometric(self.prob_block / 100)
+            self._block_running(p)
             return
         self._preempt()
 
     def _tick_blocked(self):
-        for p in list(self.blocked):
-            if p.state != ProcState.BLOCKED:
-                self.blocked.remove(p); continue
-            if p.io_remaining > 0:
-                p.io_remaining -= 1
-            if p.io_remaining <= 0:
-                p.state = ProcState.READY
-                self.ready.append(p)
-                self.blocked.remove(p)
+        # sólo se tocan los que despiertan en este tick, en el orden en que se bloquearon
+        while self.blocked and self.blocked[0][0] <= self.tick:
+            wake, _, p = heappop(self.blocked)
+            if p.state != ProcState.BLOCKED or p.wake_tick != wake:
+                continue
+            self._set_state(p, ProcState.READY)
+            self.ready.push(p)
+            rec = self.recorder
+            if rec is not None:
+                rec.event(self.tick, EV_WAKE, p.pid)
 
     def step(self):
+        if self.profiler is not None:
+            self._step_profiled()
+            return
+        self.tick += 1
+        if self._next_arrival is not None and self._next_arrival <= self.tick:
+            self._arrivals()
         self._try_admit_from_waiting()
         self._dispatch_if_needed()
         self._tick_running()
         self._tick_blocked()
+        self._dispatch_if_needed(late=True)
+        if self.recorder is not None:
+            self.recorder.tick_done(self)
+
+    def _step_profiled(self):
+        """La misma secuencia que step(), tomando la hora entre fase y fase.
+        Los tiempos incluyen lo que cada fase dispara (p.ej. terminar un
+        proceso en _tick_running admite desde la espera)."""
+        clock = perf_counter_ns
+        t0 = clock()
+        self.tick += 1
+        if self._next_arrival is not None and self._next_arrival <= self.tick:
+            self._arrivals()
+        t1 = clock()
+        self._try_admit_from_waiting()
+        t2 = clock()
         self._dispatch_if_needed()
+        t3 = clock()
+        self._tick_running()
+        t4 = clock()
+        self._tick_blocked()
+        t5 = clock()
+        self._dispatch_if_needed(late=True)
+        self.profiler.step_done(t0, t1, t2, t3, t4, t5, clock())
+        if self.recorder is not None:
+            self.recorder.tick_done(self)
+
+    # ---------- EJECUCIÓN SIN GUI ----------
+    def is_idle(self):
+        """Nada puede avanzar: no hay CPU en uso, ni listos, ni I/O pendiente,
+        ni llegadas programadas, ni nadie en la espera que entre en memoria
+        (p.ej. tras reset_memory, con todos los vivos en la espera)."""
+        return (self.running is None and not self.ready and not self.blocked
+                and self._next_arrival is None and not self._can_admit())
+
+    def run(self, until_tick=None, until_idle=True, fast_forward=True):
+        """Avanza la simulación sin GUI hasta el tick absoluto `until_tick`
+        y/o hasta quedar ociosa. Con `fast_forward` los tramos sin eventos
+        (fin de ráfaga, fin de I/O, vencimiento del quantum) se consumen de
+        una sola vez; el resultado es idéntico al de llamar a step() tick a
+        tick con la misma semilla. Devuelve el tick alcanzado."""
+        if until_tick is None and not until_idle:
+            raise ValueError("run() necesita until_tick o until_idle")
+        while until_tick is None or self.tick < until_tick:
+            if until_idle and self.is_idle():
+                break
+            if fast_forward:
+                limit = None if until_tick is None else until_tick - self.tick
+                if self.profiler is None:
+                    skipped = self._fast_forward(limit)
+                else:
+                    t0 = perf_counter_ns()
+                    skipped = self._fast_forward(limit)
+                    self.profiler.fast_forward_done(t0, perf_counter_ns(), skipped)
+                if skipped:
+                    continue
+            self.step()
+        return self.tick
+
+    def _fast_forward(self, limit=None):
+        """Consume de una vez los próximos ticks en los que sólo corren los
+        contadores (CPU, quantum, I/O). Devuelve cuántos ticks avanzó; 0 si
+        el próximo tick trae un evento y hay que darlo con step()."""
+        if self._can_admit():
+            return 0
+        p = self.running
+        if p is None and self.ready:
+            return 0
+        # último tick, contando desde el actual, que no dispara ningún evento
+        bounds = [] if limit is None else [limit]
+        if self._next_arrival is not None:
+            bounds.append(self._next_arrival - self.tick - 1)
+        if self.blocked:
+            bounds.append(self.blocked[0][0] - self.tick - 1)
+        if p is not None:
+            bounds.append(p.cpu_remaining - 1)
+            bounds.append(self.ready.quiet_ticks(p))
+        if not bounds:
+            return 0
+        n = min(bounds)
+        if n <= 0:
+            return 0
+
+        # el próximo bloqueo ya está sorteado: cae dentro del tramo o no
+        blocks_at = None
+        if p is not None and self._block_gap <= n:
+            blocks_at = self._block_gap
+        quiet = n if blocks_at is None else blocks_at - 1
+
+        self.tick += quiet
+        if p is not None:
+            p.cpu_remaining -= quiet
+            self.quantum_left -= quiet
+            self._block_gap -= quiet
+
+        if blocks_at is not None:
+            # resto del tick del bloqueo (admisión y primer despacho no cambian nada)
+            self.tick += 1
+            p.cpu_remaining -= 1
+            self.quantum_left -= 1
+            self._block_gap = self.block_rng.geometric(self.prob_block / 100)
+            self._block_running(p)
+            self._tick_blocked()
+            self._dispatch_if_needed(late=True)
+            if self.recorder is not None:
+                self.recorder.tick_done(self)
+            return blocks_at
+        return quiet
+
 
 # ============================
-#   GUI
+#   CLI
 # ============================
 
-class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Simulador de Procesos y Memoria")
-        self.geometry("1000x680")
-        self.minsize(720, 480)
-
-        # Modelo
-        self.sim = Simulator(quantum=5, cpu_time_range=(20, 60))
-        for _ in range(5):
-            self.sim.add_process()
-
-        # Layout base
-        self.columnconfigure(0, weight=1, uniform="cols")
-        self.columnconfigure(1, weight=1, uniform="cols")
-        self.rowconfigure(0, weight=1)
-
-        # Panel memoria
-        self.canvas = tk.Canvas(self, bg="#1e1e1e", highlightthickness=0)
-        self.canvas.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-
-        # Panel derecho
-        right = ttk.Frame(self)
-        right.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
-        right.rowconfigure(2, weight=1)
-        right.columnconfigure(0, weight=1)
-
-        # Barra
-        controls = ttk.Frame(right)
-        controls.grid(row=0, column=0, sticky="ew", pady=(0, 10))
-        controls.grid_columnconfigure(3, weight=1)
-        self.auto_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(controls, text="Auto", variable=self.auto_var, command=self._toggle_loop)\
-            .grid(row=0, column=0, padx=6, pady=2, sticky="w")
-        ttk.Button(controls, text="Tick", command=self._tick_once)\
-            .grid(row=0, column=1, padx=6, pady=2, sticky="w")
-        ttk.Button(controls, text="Agregar proceso", command=self._add_proc)\
-            .grid(row=0, column=2, padx=6, pady=2, sticky="w")
-        ttk.Button(controls, text="Ajustes…", command=self._open_settings)\
-            .grid(row=0, column=4, padx=6, pady=2, sticky="e")
-
-        # Resumen y tabla
-        self.summary = ttk.Label(right, text="", anchor="w", justify="left")
-        self.summary.grid(row=1, column=0, sticky="ew", pady=(0, 8))
-
-        self.tree = ttk.Treeview(
-            right, columns=("pid", "estado", "mem", "part", "cpu", "io"),
-            show="headings", height=18
-        )
-        for col, text, w in [
-            ("pid", "PID", 60), ("estado", "Estado", 110), ("mem", "Mem", 60),
-            ("part", "Part", 60), ("cpu", "CPU restante", 100), ("io", "I/O restante", 100)
-        ]:
-            self.tree.heading(col, text=text)
-            self.tree.column(col, width=w, anchor="center")
-        self.tree.grid(row=2, column=0, sticky="nsew")
-
-        # Ordenable con flechas y orden persistente
-        self._setup_sorting()
-
-        # Velocidad del loop
-        self.ms_var = tk.IntVar(value=300)
-
-        self._render_all()
-        self.after(self.ms_var.get(), self._loop)
-
-    # --- básicos ---
-    def _add_proc(self): self.sim.add_process(); self._render_all()
-    def _tick_once(self): self.sim.step(); self._render_all()
-    def _toggle_loop(self):
-        if self.auto_var.get():
-            self.after(self.ms_var.get(), self._loop)
-    def _loop(self):
-        if self.auto_var.get():
-            self.sim.step(); self._render_all(); self.after(self.ms_var.get(), self._loop)
-
-    # ---------- AJUSTES (ventana) ----------
-    def _open_settings(self):
-        win = tk.Toplevel(self); win.title("Ajustes de simulación")
-        win.grab_set(); win.resizable(False, False)
-        frm = ttk.Frame(win, padding=12); frm.pack(fill="both", expand=True)
-
-        # Velocidad
-        ttk.Label(frm, text="Velocidad (ms por tick):").grid(row=0, column=0, sticky="e", pady=2)
-        ms_var_local = tk.IntVar(value=self.ms_var.get())
-        ttk.Entry(frm, width=8, textvariable=ms_var_local).grid(row=0, column=1, sticky="w", padx=6)
-        ttk.Label(frm, text="Cada tick avanza la simulación.\nMás ms = más lento; menos ms = más rápido.",
-                  foreground="#555").grid(row=1, column=0, columnspan=2, sticky="w")
-
-        # Quantum
-        ttk.Label(frm, text="Quantum (Round Robin):").grid(row=2, column=0, sticky="e", pady=(10,2))
-        quantum_var = tk.IntVar(value=self.sim.quantum)
-        ttk.Entry(frm, width=8, textvariable=quantum_var).grid(row=2, column=1, sticky="w", padx=6)
-        ttk.Label(frm, text="Ticks que un proceso puede usar CPU antes de ser desalojado\nsi hay otros listos.",
-                  foreground="#555").grid(row=3, column=0, columnspan=2, sticky="w")
-
-        # CPU inicial
-        ttk.Label(frm, text="CPU inicial mín–máx (procesos nuevos):").grid(row=4, column=0, columnspan=2, sticky="w", pady=(10,2))
-        cpu_min_var = tk.IntVar(value=self.sim.cpu_time_range[0])
-        cpu_max_var = tk.IntVar(value=self.sim.cpu_time_range[1])
-        ttk.Entry(frm, width=6, textvariable=cpu_min_var).grid(row=5, column=0, sticky="w")
-        ttk.Entry(frm, width=6, textvariable=cpu_max_var).grid(row=5, column=1, sticky="w")
-        ttk.Label(frm, text="Duración total de CPU de los procesos al crearse.",
-                  foreground="#555").grid(row=6, column=0, columnspan=2, sticky="w")
-
-        # Prob. bloqueo
-        ttk.Label(frm, text="Prob. de bloqueo por tick (%):").grid(row=7, column=0, sticky="e", pady=(10,2))
-        prob_block_var = tk.IntVar(value=self.sim.prob_block)
-        ttk.Entry(frm, width=8, textvariable=prob_block_var).grid(row=7, column=1, sticky="w", padx=6)
-        ttk.Label(frm, text="Probabilidad de que el proceso en CPU pase a Bloqueado (I/O).",
-                  foreground="#555").grid(row=8, column=0, columnspan=2, sticky="w")
-
-        # Rango I/O
-        ttk.Label(frm, text="Rango de I/O mín–máx (ticks):").grid(row=9, column=0, columnspan=2, sticky="w", pady=(10,2))
-        io_min_var = tk.IntVar(value=self.sim.io_time_range[0])
-        io_max_var = tk.IntVar(value=self.sim.io_time_range[1])
-        ttk.Entry(frm, width=6, textvariable=io_min_var).grid(row=10, column=0, sticky="w")
-        ttk.Entry(frm, width=6, textvariable=io_max_var).grid(row=10, column=1, sticky="w")
-        ttk.Label(frm, text="Cuántos ticks permanece bloqueado un proceso por I/O.",
-                  foreground="#555").grid(row=11, column=0, columnspan=2, sticky="w")
-
-        # Aplicar a existentes
-        apply_existing_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(frm, text="Aplicar nuevo rango de CPU a procesos existentes",
-                        variable=apply_existing_var).grid(row=12, column=0, columnspan=2, sticky="w", pady=(10,0))
-        ttk.Label(frm, text="Si está marcado, reasigna la CPU restante de los procesos activos al nuevo rango.",
-                  foreground="#555").grid(row=13, column=0, columnspan=2, sticky="w")
-
-        # Particiones (opcional)
-        use_new_mem_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(frm, text="Reiniciar particiones de memoria", variable=use_new_mem_var)\
-            .grid(row=14, column=0, columnspan=2, sticky="w", pady=(10,0))
-        ttk.Label(frm, text="Si lo activás, ingresá una lista (ej: 4,4,8,16).\n"
-                            "Se reinicia la memoria y los procesos vuelven a espera.",
-                  foreground="#555").grid(row=15, column=0, columnspan=2, sticky="w")
-        mem_parts_var = tk.StringVar(value="2,2,4,6,6,8,8,12,16")
-        mem_entry = ttk.Entry(frm, width=30, textvariable=mem_parts_var, state="disabled")
-        mem_entry.grid(row=16, column=0, columnspan=2, sticky="ew", pady=(2,0))
-        def toggle_entry(*_):
-            mem_entry.configure(state="normal" if use_new_mem_var.get() else "disabled")
-        use_new_mem_var.trace_add("write", toggle_entry)
-
-        # Botones
-        btns = ttk.Frame(frm); btns.grid(row=17, column=0, columnspan=2, pady=(16,0), sticky="e")
-        ttk.Button(btns, text="Cancelar", command=win.destroy).pack(side="right", padx=6)
-        def apply_and_close():
-            try:
-                ms=int(ms_var_local.get()); q=int(quantum_var.get())
-                cmin=int(cpu_min_var.get()); cmax=int(cpu_max_var.get())
-                pbl=int(prob_block_var.get()); iomin=int(io_min_var.get()); iomax=int(io_max_var.get())
-                assert ms>=10 and q>=1 and 1<=cmin<cmax and 0<=pbl<=100 and 1<=iomin<=iomax
-                if use_new_mem_var.get():
-                    new_parts=[int(x) for x in mem_parts_var.get().split(",") if x.strip()]
-                    assert new_parts and all(s>0 for s in new_parts)
-            except Exception:
-                messagebox.showerror("Error","Valores inválidos."); return
-
-            self.ms_var.set(ms)
-            self.sim.quantum = q
-            self.sim.cpu_time_range = (cmin, cmax)
-            self.sim.prob_block = pbl
-            self.sim.io_time_range = (iomin, iomax)
-
-            if apply_existing_var.get():
-                for p in self.sim.all_procs:
-                    if p.state != ProcState.TERMINATED:
-                        p.cpu_remaining = max(1, randrange(cmin, cmax + 1))
-
-            if use_new_mem_var.get():
-                self.sim.mem = Memory(new_parts)
-                new_wait = [p for p in self.sim.all_procs if p.state != ProcState.TERMINATED]
-                for p in new_wait:
-                    p.state = ProcState.BLOCKED
-                    p.mem_index = -1
-                    p.io_remaining = 0
-                self.sim.wait_mem = deque(new_wait)
-                self.sim.ready = deque()
-                self.sim.blocked = []
-                self.sim.running = None
-
-            self._render_all()
-            win.destroy()
-        ttk.Button(btns, text="Aplicar", command=apply_and_close).pack(side="right")
-
-    # ---------- RENDER ----------
-    def _render_all(self):
-        self._render_memory()
-        self._render_processes()
-        self._render_summary()
-
-    def _render_summary(self):
-        total = self.sim.mem.total_size()
-        used  = self.sim.mem.used_size()
-        free  = total - used
-        ready = sum(p.state == ProcState.READY for p in self.sim.all_procs)
-        running = 1 if self.sim.running else 0
-        blocked = sum(p.state == ProcState.BLOCKED for p in self.sim.all_procs)
-        term    = sum(p.state == ProcState.TERMINATED for p in self.sim.all_procs)
-        wait_mem= len(self.sim.wait_mem)
-        cpu_rng = f"{self.sim.cpu_time_range[0]}–{self.sim.cpu_time_range[1]}"
-        self.summary.config(text=(
-            f"Memoria: usada {used}/{total} (libre {free}) | "
-            f"Listo: {ready} Ejecutando: {running} Bloqueado: {blocked} "
-            f"Terminado: {term} Espera Memoria: {wait_mem} | "
-            f"CPU inicial: {cpu_rng} | Quantum: {self.sim.quantum} | ms/tick: {self.ms_var.get()}"
-        ))
-
-    def _render_memory(self):
-        self.canvas.delete("all")
-        W = self.canvas.winfo_width() or 450
-        H = self.canvas.winfo_height() or 450
-        blocks = self.sim.mem.partitions
-        margin = 20; gap = 10
-        total_h = H - 2*margin - gap*(len(blocks)-1)
-        block_h = total_h / len(blocks) if blocks else 0
-        x0, x1 = margin, W - margin
-        pid2color = {p.pid: p.color for p in self.sim.all_procs}
-
-        for i, blk in enumerate(blocks):
-            y0 = margin + i*(block_h + gap); y1 = y0 + block_h
-            self.canvas.create_rectangle(x0, y0, x1, y1, outline="#aaa", width=2)
-            if blk.is_free():
-                self.canvas.create_rectangle(x0, y0, x1, y1, fill="#2b2b2b", outline="")
-                self.canvas.create_text(x0+8, (y0+y1)/2, anchor="w", fill="#ddd",
-                                        text=f"Bloque {i} size={blk.size} (LIBRE)")
-            else:
-                frac = max(0.0, min(1.0, blk.occupied/blk.size if blk.size > 0 else 0))
-                fill_w = x0 + frac*(x1 - x0)
-                color = pid2color.get(blk.owner_pid, "#3da35a")
-                self.canvas.create_rectangle(x0, y0, fill_w, y1, fill=color, outline="")
-                self.canvas.create_rectangle(fill_w, y0, x1, y1, fill="#2b2b2b", outline="")
-                self.canvas.create_text(x0+8, (y0+y1)/2, anchor="w", fill="#fff",
-                                        text=f"Bloque {i} size={blk.size} used={blk.occupied} PID={blk.owner_pid}")
-
-    def _render_processes(self):
-        # limpiar la tabla
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-
-        rows = []
-        for p in self.sim.all_procs:
-            rows.append({
-                "pid": p.pid,
-                "estado": p.state.value,
-                "mem": p.mem_required,
-                "part": (p.mem_index if p.mem_index >= 0 else "-"),
-                "cpu": p.cpu_remaining,
-                "io": p.io_remaining,
-            })
-
-        # aplicar orden actual si hay
-        if getattr(self, "_active_sort_col", None) is not None:
-            col = self._active_sort_col
-            reverse = self._active_sort_reverse
-
-            def to_int(v):
-                if isinstance(v, int): return v
-                s = str(v).strip()
-                if s in ("", "-"): return -10**12
-                try: return int(s)
-                except ValueError: return -10**12
-
-            typ = self._col_types.get(col, "str")
-            if typ == "int":
-                rows.sort(key=lambda r: (to_int(r[col]), r["pid"]), reverse=reverse)
-            else:
-                rows.sort(key=lambda r: (str(r[col]).lower(), r["pid"]), reverse=reverse)
-
-        for r in rows:
-            self.tree.insert("", "end", values=(r["pid"], r["estado"], r["mem"], r["part"], r["cpu"], r["io"]))
-
-    # ---------- ORDENAMIENTO PERSISTENTE ----------
-    def _setup_sorting(self):
-        self._col_types = {
-            "pid": "int", "estado": "str", "mem": "int",
-            "part": "int", "cpu": "int", "io": "int",
-        }
-        self._col_titles = {c: self.tree.heading(c, "text") for c in self._col_types}
-        self._sort_reverse = {c: True for c in self._col_types}  # 1er click: DESC
-        self._active_sort_col = None
-        self._active_sort_reverse = None
-
-        for col in self._col_types:
-            self.tree.heading(
-                col,
-                text=self._col_titles[col],
-                command=lambda c=col: self._sort_by(c, self._sort_reverse[c])
-            )
-
-    def _sort_by(self, col, reverse):
-        # recordar elección para próximos renders
-        self._active_sort_col = col
-        self._active_sort_reverse = reverse
-
-        # alternar para el próximo click
-        self._sort_reverse[col] = not reverse
-
-        # actualizar flechas en encabezados
-        for c in self._col_types:
-            base = self._col_titles[c]
-            if c == col:
-                base = f"{base} {'▼' if reverse else '▲'}"
-            self.tree.heading(c, text=base,
-                              command=lambda cc=c: self._sort_by(cc, self._sort_reverse[cc]))
-
-        # re-render ordenado ya mismo
-        self._render_processes()
+def _parse_range(text):
+    lo, hi = (int(x) for x in text.split(","))
+    return (lo, hi)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de procesos y memoria.")
+    parser.add_argument("--headless", action="store_true",
+                        help="correr sin interfaz gráfica y mostrar un resumen")
+    parser.add_argument("--procs", type=int, default=5, help="procesos iniciales")
+    parser.add_argument("--until-tick", type=int, default=None,
+                        help="tick absoluto en el que detenerse")
+    parser.add_argument("--no-until-idle", dest="until_idle", action="store_false",
+                        help="no detenerse cuando no queda nada por ejecutar")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--quantum", type=int, default=5)
+    parser.add_argument("--prob-block", type=int, default=20)
+    parser.add_argument("--cpu-range", type=_parse_range, default=(20, 60), metavar="MIN,MAX")
+    parser.add_argument("--io-range", type=_parse_range, default=(3, 8), metavar="MIN,MAX")
+    parser.add_argument("--admission", choices=ADMISSION_POLICIES, default="fifo",
+                        help="cómo se admite desde la espera de memoria")
+    parser.add_argument("--partitions", default="2,2,4,6,6,8,8,12,16",
+                        help="tamaños de partición separados por coma")
+    parser.add_argument("--scheduler", choices=list(SCHEDULERS), default="rr",
+                        help="planificador de CPU")
+    parser.add_argument("--memory", choices=MEMORY_KINDS, default="fixed",
+                        help="particiones fijas, dinámicas (total = suma de --partitions) o buddy")
+    parser.add_argument("--fit", choices=FIT_POLICIES, default="first",
+                        help="política de ajuste (fixed y dynamic)")
+    parser.add_argument("--compaction", action="store_true",
+                        help="compactar la memoria dinámica cuando el pedido entra sólo sumando huecos")
+    parser.add_argument("--tick-by-tick", dest="fast_forward", action="store_false",
+                        help="no saltar tramos sin eventos (para comparar)")
+    parser.add_argument("--workload", metavar="ARCHIVO", default=None,
+                        help="llegadas desde un CSV/JSONL (ver simulador_carga.py), leído de a poco")
+    parser.add_argument("--metrics-csv", metavar="ARCHIVO", default=None,
+                        help="medir fases, contadores e histogramas y guardarlos en CSV")
+    parser.add_argument("--metrics-prom", metavar="ARCHIVO", default=None,
+                        help="ídem, en formato de texto de Prometheus")
+    args = parser.parse_args(argv)
+
+    if not args.headless:
+        from simulador_gui import App
+        App().mainloop()
+        return 0
+
+    if args.until_tick is None and not args.until_idle:
+        parser.error("--no-until-idle requiere --until-tick")
+    sim = Simulator(partitions_sizes=[int(x) for x in args.partitions.split(",") if x.strip()],
+                    quantum=args.quantum, cpu_time_range=args.cpu_range,
+                    prob_block=args.prob_block, io_time_range=args.io_range, seed=args.seed,
+                    admission=args.admission, scheduler=args.scheduler,
+                    memory=args.memory, fit=args.fit, compaction=args.compaction)
+    # sólo se informan promedios: no hace falta guardar cada terminado
+    sim.terminated = TerminatedStore(keep_rows=False)
+    metrics = None
+    if args.metrics_csv or args.metrics_prom:
+        from simulador_metricas import Metrics
+        metrics = Metrics()
+        metrics.attach(sim)
+    for _ in range(args.procs):
+        sim.add_process()
+    if args.workload:
+        from simulador_carga import read_workload
+        sim.set_workload(read_workload(args.workload))
+    sim.run(until_tick=args.until_tick, until_idle=args.until_idle,
+            fast_forward=args.fast_forward)
+    if sim.workload_error is not None:
+        print(f"Error en la carga (se dejó de leer): {sim.workload_error}", file=sys.stderr)
+
+    print(f"Tick: {sim.tick}")
+    print(f"Memoria: usada {sim.mem.used_size()}/{sim.mem.total_size()} "
+          f"(libre {sim.mem.free_size()}, mayor libre {sim.mem.largest_free()}, "
+          f"frag. interna {sim.mem.internal_fragmentation()}, "
+          f"frag. externa {sim.mem.external_fragmentation():.1%})")
+    rep = sim.mem.report()
+    print(f"Asignador {rep['kind']}/{rep['fit']}: {rep['allocs']} asignaciones, "
+          f"{rep['misses']} búsquedas sin lugar, {rep['compactions']} compactaciones | "
+          f"ns medios: búsqueda {rep['mean_fit_ns']:.0f}, asignación {rep['mean_alloc_ns']:.0f}, "
+          f"liberación {rep['mean_free_ns']:.0f}")
+    print(" ".join(f"{st.value}: {n}" for st, n in sim.state_counts.items())
+          + f" Espera Memoria: {len(sim.wait_mem)}")
+    print(f"Turnaround medio: {sim.terminated.mean_turnaround():.2f} "
+          f"| Espera en listos media: {sim.terminated.mean_wait():.2f}")
+    if metrics is not None:
+        from simulador_metricas import write_csv, write_prometheus
+        c = metrics.counters
+        print(f"Cambios de contexto: {c['context_switches']} | desalojos: {c['preemptions']} "
+              f"| bloqueos por I/O: {c['io_blocks']} | admisiones: {c['admissions']} "
+              f"| respuesta media: {metrics.response.mean():.2f}")
+        if args.metrics_csv:
+            write_csv(metrics, args.metrics_csv)
+        if args.metrics_prom:
+            write_prometheus(metrics, args.metrics_prom)
+    return 1 if sim.workload_error is not None else 0
 
 if __name__ == "__main__":
-    App().mainloop()
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""Modelo de la tabla de procesos de la GUI, para cientos de miles de filas.
+
+`ProcessTable` guarda las filas (pid, estado, mem, part, cpu, io) por PID y,
+por cada columna por la que se ordenó alguna vez, un índice ordenado por
+grupo de estado (listas de claves, mantenidas con bisect a medida que llegan
+los cambios). La GUI sólo pide la ventana visible (`window`): con un filtro
+de varios grupos la posición k se ubica con búsqueda binaria sobre los
+índices de esos grupos, sin recorrer ni reordenar la lista entera. No
+importa Tkinter.
+"""
+from bisect import bisect_left, insort
+from heapq import merge
+
+COLUMNS = ("pid", "estado", "mem", "part", "cpu", "io")
+COL_TYPES = {"pid": "int", "estado": "str", "mem": "int", "part": "int", "cpu": "int", "io": "int"}
+
+# grupos en los que se filtra: los bloqueados se separan en I/O y espera de memoria
+GROUPS = ("Listo", "Ejecutando", "Bloqueado (I/O)", "Espera memoria", "Terminado")
+FILTERS = {
+    "Todos": GROUPS,
+    "Activos": GROUPS[:4],
+    **{g: (g,) for g in GROUPS},
+}
+
+def row_group(values):
+    state = values[1]
+    if state == "Bloqueado":
+        return "Espera memoria" if values[3] == "-" else "Bloqueado (I/O)"
+    return state
+
+def sort_key(col, values):
+    """Clave de orden de la fila en `col`; termina en el PID, así es única."""
+    v = values[COLUMNS.index(col)]
+    pid = values[0]
+    if COL_TYPES[col] == "int":
+        if isinstance(v, int): return (v, pid)
+        s = str(v).strip()
+        try: return (int(s), pid)
+        except ValueError: return (-10**12, pid)
+    return (str(v).lower(), pid)
+
+
+class ProcessTable:
+    def __init__(self):
+        self.rows = {}          # pid -> valores
+        self._index = {}        # columna -> {grupo: claves ordenadas}
+        self.col = "pid"        # orden activo (por PID si no se eligió otro)
+        self.reverse = False
+        self.groups = GROUPS    # filtro activo
+
+    def load(self, rows):
+        """Reemplaza todas las filas; los índices se rearman cuando se piden."""
+        self.rows = {r[0]: r for r in rows}
+        self._index = {}
+
+    def update(self, values):
+        """Agrega o actualiza una fila. Devuelve False si no cambió nada."""
+        pid = values[0]
+        old = self.rows.get(pid)
+        if old == values:
+            return False
+        self.rows[pid] = values
+        group = row_group(values)
+        old_group = row_group(old) if old is not None else None
+        for col, by_group in self._index.items():
+            key = sort_key(col, values)
+            if old is not None:
+                old_key = sort_key(col, old)
+                if old_key == key and old_group == group:
+                    continue
+                keys = by_group[old_group]
+                del keys[bisect_left(keys, old_key)]
+            insort(by_group.setdefault(group, []), key)
+        return True
+
+    def _keys(self, col):
+        by_group = self._index.get(col)
+        if by_group is None:
+            by_group = {}
+            for values in self.rows.values():
+                by_group.setdefault(row_group(values), []).append(sort_key(col, values))
+            for keys in by_group.values():
+                keys.sort()
+            self._index[col] = by_group
+        return by_group
+
+    def set_sort(self, col, reverse):
+        self.col, self.reverse = col, reverse
+        self._keys(col)
+
+    def set_filter(self, name):
+        self.groups = FILTERS[name]
+
+    def _lists(self):
+        by_group = self._keys(self.col)
+        return [by_group[g] for g in self.groups if by_group.get(g)]
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._lists())
+
+    def _rank(self, lists, key):
+        """Cuántas filas visibles van antes de `key` en orden ascendente."""
+        return sum(bisect_left(keys, key) for keys in lists)
+
+    def _starts(self, lists, k):
+        """Posición en cada lista del k-ésimo visible ascendente (k < total)."""
+        for keys in lists:
+            # el rango de keys[m] en la unión crece con m: búsqueda binaria
+            lo, hi = 0, len(keys)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                rank = self._rank(lists, keys[mid])
+                if rank == k:
+                    return [bisect_left(other, keys[mid]) for other in lists]
+                if rank < k:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        raise IndexError(k)
+
+    def window(self, offset, count):
+        """Valores de las filas visibles [offset, offset + count) en el orden activo."""
+        lists = self._lists()
+        total = sum(len(keys) for keys in lists)
+        offset = max(0, min(offset, total))
+        count = max(0, min(count, total - offset))
+        if not count:
+            return []
+        # en orden descendente la ventana es la del otro extremo, dada vuelta
+        first = total - offset - count if self.reverse else offset
+        starts = self._starts(lists, first)
+        its = [map(keys.__getitem__, range(s, len(keys))) for keys, s in zip(lists, starts)]
+        out = []
+        for key in merge(*its):
+            out.append(self.rows[key[-1]])
+            if len(out) == count:
+                break
+        if self.reverse:
+            out.reverse()
+        return out
+
+    def position(self, pid):
+        """Posición visible de `pid` en el orden activo, o None si no está o el filtro lo oculta."""
+        values = self.rows.get(pid)
+        if values is None or row_group(values) not in self.groups:
+            return None
+        lists = self._lists()
+        rank = self._rank(lists, sort_key(self.col, values))
+        return sum(len(keys) for keys in lists) - 1 - rank if self.reverse else rank
@@ -0,0 +1,251 @@
+"""Traza binaria de eventos con checkpoints, para reproducir y recorrer una corrida.
+
+`TraceRecorder` se cuelga de `Simulator.recorder` (add_recorder) y escribe
+cada evento (ver EVENT_KINDS en simulador_so.py) como un registro de ancho
+fijo en `<ruta>`. Cada `interval` eventos, y siempre que la memoria o las ráfagas se
+reemplazan desde Ajustes, agrega a `<ruta>.ckpt` una foto completa del
+estado. La foto cuesta en proporción a los procesos vivos, así que con
+muchos vivos se espacian más: al menos `per_proc` eventos por proceso vivo
+entre una y otra, y el costo por evento queda acotado. `TraceReplayer` reconstruye el estado de cualquier tick partiendo del
+último checkpoint anterior y aplicando sólo los eventos que siguen, así que
+saltar a un tick no obliga a releer la traza desde el principio.
+
+Ejemplo:
+    python simulador_traza.py corrida.trz --tick 500
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from collections import namedtuple
+
+from simulador_memoria import make_memory
+from simulador_so import (EV_ADMIT, EV_ALLOC, EV_BLOCK, EV_COMPACT, EV_DISPATCH, EV_FINISH,
+                          EV_FREE, EV_NEW, EV_PREEMPT, EV_WAKE, EVENT_KINDS, ProcState)
+
+# tick, a, pid, b, tipo (28 bytes; `a` puede ser un tick, por eso 64 bits)
+EVENT = struct.Struct("<qqiiB3x")
+# tick, índice del primer evento posterior, largo del JSON que sigue
+CKPT_HEADER = struct.Struct("<qqq")
+
+# procs:      tuplas (pid, estado, mem, part, cpu, io) como las filas de la GUI
+# partitions: tuplas (bloque, size, owner_pid, occupied); el bloque es el índice
+#             de la partición en memoria fija y la dirección en las demás
+TraceState = namedtuple("TraceState", ["tick", "procs", "partitions", "terminated"])
+
+
+class TraceRecorder:
+    def __init__(self, path, interval=4096, per_proc=8):
+        self.path = path
+        self.interval = interval
+        self.per_proc = per_proc
+        self.events = 0
+        self._since_ckpt = 0
+        self._buf = bytearray()
+        self._out = open(path, "wb")
+        self._ckpt = open(path + ".ckpt", "wb")
+
+    def attach(self, sim):
+        """Empieza a grabar `sim` desde su estado actual."""
+        sim.add_recorder(self)
+        self.checkpoint(sim)
+
+    def detach(self, sim):
+        sim.remove_recorder(self)
+        self.close()
+
+    def event(self, tick, kind, pid, a=0, b=0):
+        self._buf += EVENT.pack(tick, a, pid, b, kind)
+        self.events += 1
+        self._since_ckpt += 1
+        if len(self._buf) >= 1 << 16:
+            self._flush()
+
+    def tick_done(self, sim):
+        if (self._since_ckpt >= self.interval
+                and self._since_ckpt >= self.per_proc * len(sim.all_procs)):
+            self.checkpoint(sim)
+
+    def checkpoint(self, sim):
+        running = sim.running.pid if sim.running is not None else None
+        payload = json.dumps({
+            "tick": sim.tick,
+            "memory": sim.mem.config(),
+            "blocks": [[b.start, b.owner_pid, b.occupied] for b in sim.mem.partitions
+                       if not b.is_free()],
+            "procs": [[p.pid, p.state.name, p.mem_required, p.mem_index,
+                       p.cpu_remaining, p.wake_tick] for p in sim.all_procs.values()],
+            "running": running,
+            "terminated": len(sim.terminated),
+        }, separators=(",", ":")).encode("utf-8")
+        self._flush()
+        self._ckpt.write(CKPT_HEADER.pack(sim.tick, self.events, len(payload)))
+        self._ckpt.write(payload)
+        self._ckpt.flush()
+        self._since_ckpt = 0
+
+    def _flush(self):
+        if self._buf:
+            self._out.write(self._buf)
+            self._buf.clear()
+        self._out.flush()
+
+    def close(self):
+        if not self._out.closed:
+            self._flush()
+            self._out.close()
+            self._ckpt.close()
+
+
+class TraceReplayer:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.n_events = size // EVENT.size
+
+        # índice de checkpoints: (tick, evento, offset del JSON, largo). El
+        # archivo se mapea como el de eventos y sólo se leen los encabezados
+        self._ckpts = []
+        self._ckpt_file = open(path + ".ckpt", "rb")
+        size = os.fstat(self._ckpt_file.fileno()).st_size
+        raw = mmap.mmap(self._ckpt_file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        pos = 0
+        while pos + CKPT_HEADER.size <= len(raw):
+            tick, ev, n = CKPT_HEADER.unpack_from(raw, pos)
+            pos += CKPT_HEADER.size
+            if pos + n > len(raw):
+                break   # checkpoint cortado al final
+            self._ckpts.append((tick, ev, pos, n))
+            pos += n
+        self._ckpt_raw = raw
+        if not self._ckpts:
+            self.close()
+            raise ValueError(f"{path}: la traza no tiene checkpoints")
+        # orden estable: con dos checkpoints del mismo tick gana el último
+        self._ckpt_keys = [(t, ev) for t, ev, _, _ in self._ckpts]
+
+    def close(self):
+        for data in (self._data, self._ckpt_raw):
+            if isinstance(data, mmap.mmap):
+                data.close()
+        self._file.close()
+        self._ckpt_file.close()
+
+    def first_tick(self): return self._ckpts[0][0]
+    def last_tick(self):
+        last = self._tick_at(self.n_events - 1) if self.n_events else 0
+        return max(last, self._ckpts[-1][0])
+
+    def _tick_at(self, i):
+        return struct.unpack_from("<q", self._data, i * EVENT.size)[0]
+
+    def _first_after(self, tick, lo=0):
+        """Índice del primer evento con tick mayor que `tick`."""
+        hi = self.n_events
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._tick_at(mid) <= tick:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def events(self, start=None, end=None):
+        """Eventos (tick, tipo, pid, a, b) con start <= tick <= end."""
+        i = 0 if start is None else self._first_after(start - 1)
+        stop = self.n_events if end is None else self._first_after(end, i)
+        for j in range(i, stop):
+            tick, a, pid, b, kind = EVENT.unpack_from(self._data, j * EVENT.size)
+            yield tick, EVENT_KINDS[kind], pid, a, b
+
+    def state_at(self, tick):
+        """Estado al terminar el tick `tick` (incluye lo hecho entre ese tick y el siguiente)."""
+        tick = max(tick, self.first_tick())
+        k = bisect_right(self._ckpt_keys, (tick, self.n_events)) - 1
+        ck_tick, ev, pos, n = self._ckpts[k]
+        ck = json.loads(self._ckpt_raw[pos:pos + n])
+
+        # el mismo asignador que la corrida, con sus bloques ocupados: las
+        # asignaciones y liberaciones que siguen lo dejan igual que el original
+        cfg = ck["memory"]
+        memory = make_memory(cfg["partitions_sizes"], cfg["kind"], cfg["fit"], cfg["compaction"])
+        for start, owner, occupied in ck["blocks"]:
+            memory.allocate(start, owner, occupied)
+        # pid -> [estado, mem, part, cpu, wake_tick]
+        procs = {pid: [ProcState[st], mem, idx, cpu, wake]
+                 for pid, st, mem, idx, cpu, wake in ck["procs"]}
+        terminated = ck["terminated"]
+        # CPU del que corre: `ref_cpu` al final del tick `ref_tick`, y baja uno por tick
+        running = ck["running"]
+        ref_tick, ref_cpu = ck_tick, (procs[running][3] if running is not None else 0)
+
+        stop = self._first_after(tick, ev)
+        for j in range(ev, stop):
+            t, a, pid, b, kind = EVENT.unpack_from(self._data, j * EVENT.size)
+            if kind == EV_NEW:
+                procs[pid] = [ProcState.BLOCKED, a, -1, b, 0]
+            elif kind == EV_ALLOC:
+                memory.allocate(a, pid, b)
+                procs[pid][2] = a
+            elif kind == EV_FREE:
+                memory.free(a)
+            elif kind == EV_COMPACT:
+                for block in memory.compact():
+                    procs[block.owner_pid][2] = block.start
+            elif kind == EV_ADMIT or kind == EV_WAKE:
+                procs[pid][0] = ProcState.READY
+            elif kind == EV_DISPATCH:
+                procs[pid][0] = ProcState.RUNNING
+                running, ref_tick, ref_cpu = pid, t, (a if b else a - 1)
+            elif kind == EV_PREEMPT:
+                procs[pid][0], procs[pid][3] = ProcState.READY, a
+                running = None
+            elif kind == EV_BLOCK:
+                procs[pid][0], procs[pid][4], procs[pid][3] = ProcState.BLOCKED, a, b
+                running = None
+            elif kind == EV_FINISH:
+                del procs[pid]
+                terminated += 1
+                running = None
+        if running is not None:
+            procs[running][3] = ref_cpu - (tick - ref_tick)
+
+        rows = []
+        for pid, (st, mem, idx, cpu, wake) in procs.items():
+            io = max(0, wake - tick) if st == ProcState.BLOCKED and idx >= 0 else 0
+            rows.append((pid, st.value, mem, idx if idx >= 0 else "-", cpu, io))
+        partitions = tuple((b.start, b.size, b.owner_pid, b.occupied) for b in memory.partitions)
+        return TraceState(tick, tuple(rows), partitions, terminated)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspeccionar una traza del simulador.")
+    parser.add_argument("trace")
+    parser.add_argument("--tick", type=int, default=None, help="mostrar el estado en este tick")
+    parser.add_argument("--events", metavar="DESDE,HASTA", default=None,
+                        help="listar los eventos entre esos ticks")
+    args = parser.parse_args(argv)
+
+    rep = TraceReplayer(args.trace)
+    print(f"Eventos: {rep.n_events} | checkpoints: {len(rep._ckpts)} "
+          f"| ticks {rep.first_tick()}–{rep.last_tick()}")
+    if args.events:
+        lo, hi = (int(x) for x in args.events.split(","))
+        for ev in rep.events(lo, hi):
+            print(*ev)
+    if args.tick is not None:
+        st = rep.state_at(args.tick)
+        print(f"Tick {st.tick} | terminados: {st.terminated}")
+        for row in st.procs:
+            print("  ", *row)
+        for i, size, owner, occ in st.partitions:
+            print(f"   P{i} [{size}] " + (f"PID {owner} ({occ})" if owner is not None else "libre"))
+    rep.close()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,258 @@
+"""Motor vectorizado (NumPy) para correr muchas réplicas independientes a la vez.
+
+Mismo modelo que `Simulator.step` (Round Robin + particiones fijas first-fit,
+admisión FIFO desde la espera de memoria), pero la tabla de procesos es un
+conjunto de arreglos de forma (réplicas, procesos) y cada tick avanza las R
+réplicas juntas con sorteos en lote. Sirve para Monte-Carlo: no reproduce la
+corrida de un `Simulator` con la misma semilla (usa otro generador), pero las
+distribuciones coinciden; `run_reference` corre el motor de referencia con los
+mismos parámetros para compararlas.
+
+Requiere NumPy (`pip install numpy`); el resto del simulador no lo necesita.
+"""
+import argparse
+import math
+
+import numpy as np
+
+from simulador_so import Process, Simulator, _parse_range
+
+# códigos de estado, en el mismo orden que ProcState
+READY, RUNNING, BLOCKED, TERMINATED = range(4)
+
+# Orden de la cola de listos: cada encolado recibe una clave creciente
+# (tick, fase, orden dentro de la fase). Dentro de un tick el orden de
+# referencia es: admisiones al inicio, admisión tras fin / desalojo, y por
+# último los que despiertan de I/O según el tick en que se bloquearon.
+_PHASE_BITS = 31
+_TICK_SHIFT = _PHASE_BITS + 2
+_NOT_READY = np.iinfo(np.int64).max
+
+def _ready_key(tick, phase, sub):
+    return (np.int64(tick) << _TICK_SHIFT) | (np.int64(phase) << _PHASE_BITS) | sub
+
+
+class VecSimulator:
+    """R réplicas de `n_procs` procesos iniciales cada una, en arreglos NumPy."""
+    def __init__(self, replicas, n_procs, partitions_sizes=None, quantum=5,
+                 cpu_time_range=(20, 60), prob_block=20, io_time_range=(3, 8),
+                 mem_req_range=(1, 12), seed=None):
+        if partitions_sizes is None:
+            partitions_sizes = [2,2,4,6,6,8,8,12,16]
+        R, N = int(replicas), int(n_procs)
+        self.replicas, self.n_procs = R, N
+        self.quantum = max(1, int(quantum))
+        self.prob_block = prob_block
+        self.io_time_range = io_time_range
+        self.rng = np.random.default_rng(seed)
+        self.tick = 0
+        self._rows = np.arange(R)
+
+        # tabla de procesos (struct-of-arrays)
+        self.pid = np.arange(Process._next_pid, Process._next_pid + N)
+        self.state = np.full((R, N), BLOCKED, dtype=np.int8)
+        self.mem_required = self.rng.integers(mem_req_range[0], mem_req_range[1] + 1,
+                                              size=(R, N), dtype=np.int32)
+        self.cpu_remaining = self.rng.integers(cpu_time_range[0], cpu_time_range[1] + 1,
+                                               size=(R, N), dtype=np.int32)
+        self.io_remaining = np.zeros((R, N), dtype=np.int32)
+        self.mem_index = np.full((R, N), -1, dtype=np.int32)
+        self.ready_key = np.full((R, N), _NOT_READY, dtype=np.int64)
+        self.block_tick = np.zeros((R, N), dtype=np.int64)
+        self.finish_tick = np.full((R, N), -1, dtype=np.int64)
+
+        # memoria: dueño (índice de proceso) de cada partición, -1 si libre
+        self.part_size = np.asarray(partitions_sizes, dtype=np.int32)
+        self.part_owner = np.full((R, len(self.part_size)), -1, dtype=np.int32)
+
+        self.running = np.full(R, -1, dtype=np.int32)
+        self.quantum_left = np.full(R, self.quantum, dtype=np.int32)
+        self.idle_tick = np.full(R, -1, dtype=np.int64)
+
+        # alta inicial, proceso por proceso como add_process
+        for i in range(N):
+            idx = self._first_fit(self.mem_required[:, i])
+            ok = idx >= 0
+            r = self._rows[ok]
+            self._allocate(r, np.full(len(r), i), idx[ok])
+            self.ready_key[r, i] = _ready_key(0, 0, i)
+        self._mark_idle()
+
+    # ---------- memoria ----------
+    def _first_fit(self, req):
+        fits = (self.part_owner < 0) & (self.part_size[None, :] >= req[:, None])
+        idx = fits.argmax(axis=1)
+        idx[~fits.any(axis=1)] = -1
+        return idx
+
+    def _allocate(self, r, j, idx):
+        self.part_owner[r, idx] = j
+        self.mem_index[r, j] = idx
+        self.state[r, j] = READY
+
+    # ---------- transiciones ----------
+    def _try_admit_from_waiting(self, phase):
+        # FIFO: el primero de la espera es el de menor índice (entraron en orden)
+        sub = 0
+        while True:
+            waiting = (self.state == BLOCKED) & (self.mem_index < 0)
+            has = waiting.any(axis=1)
+            if not has.any():
+                return
+            head = waiting.argmax(axis=1)
+            idx = self._first_fit(self.mem_required[self._rows, head])
+            ok = has & (idx >= 0)
+            if not ok.any():
+                return
+            r, j = self._rows[ok], head[ok]
+            self._allocate(r, j, idx[ok])
+            self.ready_key[r, j] = _ready_key(self.tick, phase, sub)
+            sub += 1
+
+    def _dispatch_if_needed(self):
+        keys = np.where(self.state == READY, self.ready_key, _NOT_READY)
+        j = keys.argmin(axis=1)
+        ok = (self.running < 0) & (keys[self._rows, j] != _NOT_READY)
+        r, j = self._rows[ok], j[ok]
+        self.state[r, j] = RUNNING
+        self.ready_key[r, j] = _NOT_READY
+        self.running[ok] = j
+        self.quantum_left[ok] = self.quantum
+
+    def _tick_running(self):
+        act = self.running >= 0
+        r, j = self._rows[act], self.running[act]
+        self.cpu_remaining[r, j] -= 1
+        self.quantum_left[act] -= 1
+
+        fin = self.cpu_remaining[r, j] <= 0
+        rf, jf = r[fin], j[fin]
+        self.state[rf, jf] = TERMINATED
+        self.finish_tick[rf, jf] = self.tick
+        self.part_owner[rf, self.mem_index[rf, jf]] = -1
+        self.mem_index[rf, jf] = -1
+        self.running[rf] = -1
+        if len(rf):
+            self._try_admit_from_waiting(phase=1)
+
+        r, j = r[~fin], j[~fin]
+        blk = self.rng.integers(0, 100, size=len(r)) < self.prob_block
+        rb, jb = r[blk], j[blk]
+        self.state[rb, jb] = BLOCKED
+        self.io_remaining[rb, jb] = self.rng.integers(
+            self.io_time_range[0], self.io_time_range[1] + 1, size=len(rb))
+        self.block_tick[rb, jb] = self.tick
+        self.running[rb] = -1
+
+        r, j = r[~blk], j[~blk]
+        others = (self.state[r] == READY).any(axis=1)
+        pre = (self.quantum_left[r] <= 0) & others
+        rp, jp = r[pre], j[pre]
+        self.state[rp, jp] = READY
+        self.ready_key[rp, jp] = _ready_key(self.tick, 1, 0)
+        self.running[rp] = -1
+
+    def _tick_blocked(self):
+        io_blocked = (self.state == BLOCKED) & (self.mem_index >= 0)
+        self.io_remaining[io_blocked & (self.io_remaining > 0)] -= 1
+        wake = io_blocked & (self.io_remaining <= 0)
+        self.state[wake] = READY
+        self.ready_key[wake] = _ready_key(self.tick, 2, self.block_tick[wake])
+
+    def step(self):
+        self.tick += 1
+        self._try_admit_from_waiting(phase=0)
+        self._dispatch_if_needed()
+        self._tick_running()
+        self._tick_blocked()
+        self._dispatch_if_needed()
+        self._mark_idle()
+
+    # ---------- ejecución ----------
+    def _idle(self):
+        busy = (self.state == READY) | ((self.state == BLOCKED) & (self.mem_index >= 0))
+        return (self.running < 0) & ~busy.any(axis=1)
+
+    def _mark_idle(self):
+        new = (self.idle_tick < 0) & self._idle()
+        self.idle_tick[new] = self.tick
+
+    def run(self, until_tick=None, until_idle=True):
+        """Avanza todas las réplicas hasta `until_tick` y/o hasta que todas queden ociosas."""
+        if until_tick is None and not until_idle:
+            raise ValueError("run() necesita until_tick o until_idle")
+        while until_tick is None or self.tick < until_tick:
+            if until_idle and (self.idle_tick >= 0).all():
+                break
+            self.step()
+        return self.tick
+
+    def makespans(self):
+        """Tick en que cada réplica quedó ociosa (-1 si todavía no)."""
+        return self.idle_tick.copy()
+
+    def mean_turnaround(self):
+        """Turnaround medio de los terminados de cada réplica (todos llegan en el tick 0)."""
+        done = self.finish_tick >= 0
+        total = np.where(done, self.finish_tick, 0).sum(axis=1)
+        return total / np.maximum(done.sum(axis=1), 1)
+
+
+def run_reference(replicas, n_procs, seed=None, until_tick=None, **params):
+    """Mismas métricas que VecSimulator, con `Simulator` réplica por réplica."""
+    makespans, turnarounds = [], []
+    for i in range(replicas):
+        sim = Simulator(seed=None if seed is None else seed + i, **params)
+        for _ in range(n_procs):
+            sim.add_process()
+        sim.run(until_tick=until_tick, until_idle=True)
+        makespans.append(sim.tick if sim.is_idle() else -1)
+        turnarounds.append(sim.terminated.mean_turnaround())
+    return np.array(makespans), np.array(turnarounds)
+
+
+def mean_ci(values, z=1.96):
+    """Media y semiancho del intervalo de confianza normal."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return float(values.mean()), math.inf
+    return float(values.mean()), float(z * values.std(ddof=1) / math.sqrt(len(values)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Réplicas Monte-Carlo vectorizadas.")
+    parser.add_argument("--replicas", type=int, default=1000)
+    parser.add_argument("--procs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--until-tick", type=int, default=None)
+    parser.add_argument("--quantum", type=int, default=5)
+    parser.add_argument("--prob-block", type=int, default=20)
+    parser.add_argument("--cpu-range", type=_parse_range, default=(20, 60), metavar="MIN,MAX")
+    parser.add_argument("--io-range", type=_parse_range, default=(3, 8), metavar="MIN,MAX")
+    parser.add_argument("--partitions", default="2,2,4,6,6,8,8,12,16")
+    parser.add_argument("--compare", type=int, default=0, metavar="N",
+                        help="correr también N réplicas del motor de referencia")
+    args = parser.parse_args(argv)
+
+    params = dict(partitions_sizes=[int(x) for x in args.partitions.split(",") if x.strip()],
+                  quantum=args.quantum, cpu_time_range=args.cpu_range,
+                  prob_block=args.prob_block, io_time_range=args.io_range)
+    vec = VecSimulator(args.replicas, args.procs, seed=args.seed, **params)
+    vec.run(until_tick=args.until_tick)
+    done = vec.makespans() >= 0
+    m, h = mean_ci(vec.makespans()[done]) if done.any() else (math.nan, math.nan)
+    t, th = mean_ci(vec.mean_turnaround())
+    print(f"Vectorizado ({args.replicas} réplicas): makespan {m:.2f} ± {h:.2f} "
+          f"| turnaround medio {t:.2f} ± {th:.2f} | sin terminar: {(~done).sum()}")
+    if args.compare:
+        ms, ts = run_reference(args.compare, args.procs, seed=args.seed,
+                               until_tick=args.until_tick, **params)
+        ok = ms >= 0
+        m, h = mean_ci(ms[ok]) if ok.any() else (math.nan, math.nan)
+        t, th = mean_ci(ts)
+        print(f"Referencia  ({args.compare} réplicas): makespan {m:.2f} ± {h:.2f} "
+              f"| turnaround medio {t:.2f} ± {th:.2f} | sin terminar: {(~ok).sum()}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
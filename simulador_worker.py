@@ -0,0 +1,254 @@
+"""Simulación en un hilo aparte, desacoplada del ritmo de dibujo de la GUI.
+
+El `Simulator` vive sólo dentro de `SimWorker`: la GUI nunca lo toca. Le
+manda órdenes por `commands` (send) y lee el estado de `snapshots`, una cola
+de un solo lugar con la última foto inmutable (`Snapshot`). Si la GUI no
+llegó a tomar una foto, el worker la retira y la fusiona con la siguiente:
+los cambios no se pierden, sólo se saltean estados intermedios.
+
+No importa Tkinter; cualquier interfaz puede consumir las fotos.
+"""
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from simulador_carga import read_workload
+from simulador_metricas import Metrics
+from simulador_so import ProcState
+from simulador_traza import TraceRecorder
+
+# rows:       tuplas (pid, estado, mem, part, cpu, io) de las filas que cambiaron
+#             (todas si `full`)
+# partitions: tuplas (índice, size, owner_pid, occupied, color) de las particiones
+#             que cambiaron (todas si `mem_reset`: con memoria dinámica o buddy,
+#             cada vez que los bloques cambian de forma)
+# counts:     {valor de ProcState: cantidad}
+# metrics:    Metrics.summary() si las métricas están activas, si no None
+# config:     {quantum, cpu_time_range, prob_block, io_time_range, admission, scheduler,
+#              memory, fit, compaction}
+# error:      mensaje de la última orden o tanda de ticks que falló (p.ej. una carga
+#             mal formada o una traza que no se pudo abrir), una sola vez; si no None
+Snapshot = namedtuple("Snapshot", [
+    "tick", "full", "rows", "mem_reset", "n_partitions", "partitions",
+    "mem_total", "mem_used", "mem_largest_free", "mem_internal_frag", "mem_external_frag",
+    "counts", "wait_mem", "config", "metrics", "error",
+])
+
+def sim_config(sim):
+    return {"quantum": sim.quantum, "cpu_time_range": sim.cpu_time_range,
+            "prob_block": sim.prob_block, "io_time_range": sim.io_time_range,
+            "admission": sim.admission, "scheduler": sim.scheduler,
+            "memory": sim.mem.kind, "fit": sim.mem.fit_policy, "compaction": sim.mem.compaction}
+
+
+class SimWorker(threading.Thread):
+    """Hilo dueño del simulador.
+
+    Órdenes (send): "step", "add", "auto" (bool), "speed" (ms por tick; 0 = lo
+    más rápido posible), "configure" (kwargs de Simulator.configure),
+    "record" (ruta de la traza, o None para dejar de grabar), "workload"
+    (ruta de un CSV/JSONL de llegadas), "metrics" (bool: medir fases,
+    contadores e histogramas; ver simulador_metricas.py), "stop".
+    """
+    MAX_CHUNK = 10_000   # ticks por tanda cuando corre sin pausa
+
+    def __init__(self, sim, ms_per_tick=300, auto=True, fps=30):
+        super().__init__(name="SimWorker", daemon=True)
+        self.sim = sim
+        self.commands = queue.Queue()
+        self.snapshots = queue.Queue(maxsize=1)
+        self._ms = ms_per_tick
+        self._auto = auto
+        self._frame = 1.0 / fps
+        self._running = True
+        self._mem = None
+        self._mem_version = None
+        self._term_seen = 0
+        self._trace = None     # TraceRecorder activo
+        self._metrics = None   # Metrics activa
+        self._error = None     # error pendiente de publicar
+        self._full = True   # la primera foto (y la que sigue a Ajustes) va completa
+        sim.enable_change_tracking()
+
+    # ---------- lado GUI ----------
+    def send(self, cmd, *args):
+        self.commands.put((cmd, args))
+
+    def latest(self):
+        """Última foto publicada, o None si no hay una nueva."""
+        try:
+            return self.snapshots.get_nowait()
+        except queue.Empty:
+            return None
+
+    def stop(self, timeout=1.0):
+        self.send("stop")
+        self.join(timeout)
+
+    # ---------- lado worker ----------
+    def _guarded(self, what, fn, *args):
+        """Corre `fn(*args)`; si falla, el error va en la próxima foto en vez
+        de terminar el hilo (y con él las actualizaciones de la GUI)."""
+        try:
+            fn(*args)
+        except Exception as e:
+            self._error = f"{what}: {e}"
+
+    def _handle(self, cmd, args):
+        sim = self.sim
+        if cmd == "step":
+            sim.step()
+        elif cmd == "add":
+            sim.add_process()
+        elif cmd == "auto":
+            self._auto = bool(args[0])
+        elif cmd == "speed":
+            self._ms = max(0, int(args[0]))
+            self._next_tick = time.perf_counter() + self._ms / 1000
+        elif cmd == "configure":
+            sim.configure(**args[0])
+            self._full = True
+        elif cmd == "record":
+            if self._trace is not None:
+                self._trace.detach(sim)
+                self._trace = None
+            if args[0]:
+                self._trace = TraceRecorder(args[0])
+                self._trace.attach(sim)
+        elif cmd == "metrics":
+            if args[0] and self._metrics is None:
+                self._metrics = Metrics()
+                self._metrics.attach(sim)
+            elif not args[0] and self._metrics is not None:
+                self._metrics.detach(sim)
+                self._metrics = None
+        elif cmd == "workload":
+            sim.set_workload(read_workload(args[0]))
+        elif cmd == "stop":
+            self._running = False
+            if self._trace is not None:
+                self._trace.detach(sim)
+
+    def _advance(self, due):
+        """Avanza `due` ticks; con ms=0, todos los que entren en un frame."""
+        sim = self.sim
+        if self._ms > 0:
+            sim.run(until_tick=sim.tick + due, until_idle=False)
+            return
+        deadline = time.perf_counter() + self._frame
+        chunk = 64
+        while time.perf_counter() < deadline:
+            sim.run(until_tick=sim.tick + chunk, until_idle=False)
+            chunk = min(chunk * 2, self.MAX_CHUNK)
+
+    def run(self):
+        self._next_tick = time.perf_counter() + self._ms / 1000
+        last_pub = 0.0
+        pending = True
+        while self._running:
+            now = time.perf_counter()
+            period = self._ms / 1000
+            if not self._auto:
+                self._next_tick = now + period
+            elif period <= 0:
+                self._guarded("simulación", self._advance, 0)
+                pending = True
+            elif now >= self._next_tick:
+                due = int((now - self._next_tick) / period) + 1
+                if due > self.MAX_CHUNK:   # muy atrasado: no intentar ponerse al día
+                    due, self._next_tick = self.MAX_CHUNK, now
+                self._guarded("simulación", self._advance, due)
+                self._next_tick += due * period
+                pending = True
+
+            now = time.perf_counter()
+            if pending and now - last_pub >= self._frame:
+                self._publish()
+                last_pub, pending = now, False
+
+            # esperar órdenes hasta el próximo tick o la próxima foto pendiente
+            waits = []
+            if self._auto:
+                waits.append(self._next_tick - now if period > 0 else 0)
+            if pending:
+                waits.append(self._frame - (now - last_pub))
+            timeout = max(0.0, min(waits)) if waits else None
+            try:
+                cmd, args = self.commands.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            while True:
+                self._guarded(f"orden {cmd}", self._handle, cmd, args)
+                pending = True
+                try:
+                    cmd, args = self.commands.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _row(self, p):
+        return (p.pid, p.state.value, p.mem_required,
+                (p.mem_index if p.mem_index >= 0 else "-"),
+                p.cpu_remaining, self.sim.io_remaining(p))
+
+    def _publish(self):
+        sim = self.sim
+        pids, parts = sim.take_changes()
+        full = self._full
+        mem_reset = full or sim.mem is not self._mem or sim.mem.version != self._mem_version
+        self._full, self._mem, self._mem_version = False, sim.mem, sim.mem.version
+
+        rows = {}
+        term = sim.terminated
+        for i in range(0 if full else self._term_seen, len(term)):
+            pid = term.pid[i]
+            rows[pid] = (pid, ProcState.TERMINATED.value, term.mem_required[i], "-", 0, 0)
+        self._term_seen = len(term)
+        if full:
+            live = sim.all_procs.values()
+        else:
+            # además de las transiciones, corren solos la CPU del que ejecuta y el I/O de los bloqueados
+            live = [sim.all_procs[pid] for pid in pids if pid in sim.all_procs]
+            if sim.running is not None:
+                live.append(sim.running)
+            live.extend(sim.io_blocked())
+        for p in live:
+            rows[p.pid] = self._row(p)
+
+        blocks = sim.mem.partitions
+        partitions = {}
+        for i in (range(len(blocks)) if mem_reset else parts):
+            blk = blocks[i]
+            owner = sim.all_procs.get(blk.owner_pid)
+            partitions[i] = (i, blk.size, blk.owner_pid, blk.occupied,
+                             owner.color if owner else "#3da35a")
+
+        if sim.workload_error is not None:
+            self._error = f"carga de trabajos: {sim.workload_error}"
+            sim.workload_error = None
+        error, self._error = self._error, None
+        # si la GUI no tomó la foto anterior, se retira y se fusiona con ésta
+        old = self.latest()
+        if old is not None:
+            error = error or old.error
+            if not full:
+                rows = {**{r[0]: r for r in old.rows}, **rows}
+                full = old.full
+            if not mem_reset:
+                partitions = {**{b[0]: b for b in old.partitions}, **partitions}
+                mem_reset = old.mem_reset
+
+        mem = sim.mem
+        self.snapshots.put_nowait(Snapshot(
+            tick=sim.tick, full=full, rows=tuple(rows.values()),
+            mem_reset=mem_reset, n_partitions=len(blocks),
+            partitions=tuple(partitions.values()),
+            mem_total=mem.total_size(), mem_used=mem.used_size(),
+            mem_largest_free=mem.largest_free(),
+            mem_internal_frag=mem.internal_fragmentation(),
+            mem_external_frag=mem.external_fragmentation(),
+            counts={st.value: n for st, n in sim.state_counts.items()},
+            wait_mem=len(sim.wait_mem), config=sim_config(sim),
+            metrics=self._metrics.summary() if self._metrics is not None else None,
+            error=error,
+        ))
@@ -0,0 +1,362 @@
+"""Pruebas de regresión del núcleo (sin GUI).
+
+    python -m unittest test_simulador     (o python -m pytest)
+
+- run() con fast-forward tiene que dar exactamente lo mismo que avanzar
+  tick a tick: mismos eventos, mismo estado final.
+- Memory.first_fit (árbol de segmentos) tiene que coincidir con recorrer
+  las particiones en orden.
+- Los asignadores (simulador_memoria.py) eligen el mismo bloque que una
+  búsqueda lineal y mantienen sus invariantes: bloques contiguos, huecos
+  fusionados, bloques buddy alineados, contabilidad de lo usado.
+- Un trabajo mal formado o fuera de orden desconecta la carga sin cortar
+  el tick en curso, y los lectores rechazan filas inválidas con su línea.
+- TraceReplayer.state_at tiene que dar el mismo estado que tenía el
+  simulador en vivo en ese tick.
+- WaitQueue elige, con cada política de admisión, el mismo proceso que
+  recorrer la cola en orden de llegada.
+- ProcessTable.window / position coinciden con filtrar y ordenar la lista
+  entera, en los dos sentidos.
+"""
+import os
+import random
+import tempfile
+import unittest
+
+from simulador_carga import Job, read_workload
+from simulador_memoria import BuddyMemory, make_memory
+from simulador_planificador import SCHEDULERS
+from simulador_so import (ADMISSION_POLICIES, MEMORY_KINDS, Memory, Process, Simulator,
+                          WaitQueue)
+from simulador_tabla import COLUMNS, FILTERS, ProcessTable, row_group, sort_key
+from simulador_traza import TraceRecorder, TraceReplayer
+
+
+class _Events:
+    """Receptor que sólo junta los eventos."""
+    def __init__(self): self.events = []
+    def event(self, tick, kind, pid, a=0, b=0): self.events.append((tick, kind, pid, a, b))
+    def tick_done(self, sim): pass
+    def checkpoint(self, sim): pass
+
+
+def _state(sim):
+    procs = [(p.pid, p.state, p.mem_index, p.cpu_remaining, sim.io_remaining(p))
+             for p in sim.all_procs.values()]
+    return (sim.tick, procs, getattr(sim.running, "pid", None), [p.pid for p in sim.ready],
+            [(b.start, b.size, b.owner_pid, b.occupied) for b in sim.mem.partitions],
+            list(sim.terminated.rows()))
+
+
+class FastForwardTest(unittest.TestCase):
+    def _run(self, params, procs, fast_forward):
+        Process._next_pid = 100   # los PID son globales: las dos corridas los repiten
+        sim = Simulator(**params)
+        rec = _Events()
+        sim.add_recorder(rec)
+        for _ in range(procs):
+            sim.add_process()
+        sim.run(until_tick=20_000, fast_forward=fast_forward)
+        return rec.events, _state(sim)
+
+    def test_matches_tick_by_tick(self):
+        r = random.Random(1)
+        for scheduler in SCHEDULERS:
+            for memory in MEMORY_KINDS:
+                for seed in range(4):
+                    params = dict(
+                        seed=seed, scheduler=scheduler, memory=memory,
+                        fit=r.choice(("first", "best")), compaction=r.random() < 0.5,
+                        admission=r.choice(ADMISSION_POLICIES),
+                        partitions_sizes=[r.randint(4, 16) for _ in range(r.randint(1, 6))],
+                        quantum=r.randint(1, 8), prob_block=r.choice((0, 1, 5, 30)),
+                        cpu_time_range=(r.randint(5, 50), r.randint(50, 400)),
+                        io_time_range=(r.randint(1, 5), r.randint(5, 40)))
+                    procs = r.randint(1, 12)
+                    with self.subTest(**params):
+                        ff_events, ff_state = self._run(params, procs, True)
+                        events, state = self._run(params, procs, False)
+                        # el primer evento distinto (un diff de la lista entera es lentísimo)
+                        first = next((i for i, (a, b) in enumerate(zip(ff_events, events))
+                                      if a != b), None)
+                        if first is not None:
+                            self.fail(f"evento {first}: {ff_events[first]} != {events[first]}")
+                        self.assertEqual(len(ff_events), len(events))
+                        self.assertTrue(ff_state == state, "estado final distinto")
+
+
+class IdleTest(unittest.TestCase):
+    def test_waiters_that_fit_are_not_idle(self):
+        # reset_memory deja a todos los vivos en la espera: run() tiene que admitirlos
+        sim = Simulator(seed=1, prob_block=20)
+        for _ in range(5):
+            sim.add_process()
+        sim.run(until_tick=10)
+        sim.configure(partitions_sizes=[16, 16])
+        self.assertFalse(sim.is_idle())
+        sim.run()
+        self.assertEqual((len(sim.all_procs), len(sim.wait_mem)), (0, 0))
+
+    def test_admission_change_is_not_idle(self):
+        # con "fifo" el primero no entra; con "first" sí entra uno de atrás
+        sim = Simulator(seed=1, partitions_sizes=[8])
+        sim.add_process(mem_required=8, cpu_time=50)
+        sim.add_process(mem_required=16, cpu_time=10)   # no entra nunca
+        sim.add_process(mem_required=4, cpu_time=10)
+        sim.run()
+        self.assertEqual(len(sim.wait_mem), 2)
+        sim.configure(admission="first")
+        self.assertFalse(sim.is_idle())
+        sim.run()
+        self.assertEqual(len(sim.wait_mem), 1)
+
+
+class FirstFitTest(unittest.TestCase):
+    def test_matches_linear_scan(self):
+        r = random.Random(2)
+        for _ in range(500):
+            mem = Memory([r.randint(1, 20) for _ in range(r.randint(1, 40))])
+            for _ in range(60):
+                req = r.randint(0, 22)
+                linear = next((i for i, p in enumerate(mem.partitions)
+                               if p.is_free() and p.size >= req), None)
+                self.assertEqual(mem.first_fit(req), linear)
+                if linear is not None and req and r.random() < 0.6:
+                    mem.allocate(linear, 1, req)
+                used = [i for i, p in enumerate(mem.partitions) if not p.is_free()]
+                if used and r.random() < 0.4:
+                    mem.free(r.choice(used))
+
+
+class AllocatorTest(unittest.TestCase):
+    @staticmethod
+    def _linear_fit(mem, req, kind, policy):
+        free = [b for b in mem.partitions if b.is_free() and b.size >= req]
+        if kind == "buddy":
+            free = [b for b in free if b.size >= 1 << BuddyMemory.order(req)]
+            if not free:
+                return None
+            smallest = min(b.size for b in free)
+            return min(b.start for b in free if b.size == smallest)
+        if not free:
+            return None
+        if policy == "first":
+            return free[0].start
+        if policy == "next":
+            return ([b for b in free if b.start >= mem._rover] or free)[0].start
+        if policy == "best":
+            return min(free, key=lambda b: (b.size, b.start)).start
+        return max(free, key=lambda b: (b.size, b.start)).start
+
+    def _check_invariants(self, mem, kind):
+        blocks = mem.partitions
+        addr = 0
+        for b in blocks:
+            if kind != "fixed":
+                self.assertEqual(b.start, addr, "bloques no contiguos")
+            addr += b.size
+        self.assertEqual(addr, mem.total_size())
+        self.assertEqual(mem.used_size(), sum(b.occupied for b in blocks))
+        self.assertEqual(mem.largest_free(), max([b.size for b in blocks if b.is_free()], default=0))
+        if kind == "dynamic":
+            for x, y in zip(blocks, blocks[1:]):
+                self.assertFalse(x.is_free() and y.is_free(), "huecos sin fusionar")
+        if kind == "buddy":
+            for b in blocks:
+                self.assertEqual(b.size & (b.size - 1), 0)
+                self.assertEqual(b.start % b.size, 0)
+
+    def test_matches_linear_scan_and_keeps_invariants(self):
+        r = random.Random(4)
+        for trial in range(600):
+            kind = r.choice(MEMORY_KINDS)
+            policy = r.choice(("first", "next", "best", "worst"))
+            mem = make_memory([r.randint(1, 20) for _ in range(r.randint(1, 12))], kind, policy,
+                              compaction=True)
+            for pid in range(80):
+                req = r.randint(1, 24)
+                handle = mem.fit(req)
+                self.assertEqual(handle, self._linear_fit(mem, req, kind, policy),
+                                 f"{kind}/{policy}, prueba {trial}")
+                if handle is not None and r.random() < 0.6:
+                    block = mem.allocate(handle, pid, req)
+                    self.assertEqual((block.owner_pid, block.occupied), (pid, req))
+                used = [b.start for b in mem.partitions if not b.is_free()]
+                if used and r.random() < 0.4:
+                    mem.free(r.choice(used))
+                if kind == "dynamic" and r.random() < 0.05:
+                    before = sorted((b.owner_pid, b.size) for b in mem.partitions if not b.is_free())
+                    mem.compact()
+                    self.assertEqual(before, sorted((b.owner_pid, b.size) for b in mem.partitions
+                                                    if not b.is_free()))
+                    self.assertLessEqual(sum(b.is_free() for b in mem.partitions), 1)
+                self._check_invariants(mem, kind)
+
+    def test_rejects_empty_requests(self):
+        for kind in MEMORY_KINDS:
+            mem = make_memory([16, 16], kind)
+            for req in (0, -3):
+                with self.assertRaises(ValueError):
+                    mem.allocate(mem.fit(1), 1, req)
+            self.assertEqual(mem.used_size(), 0)
+            self.assertEqual(len(mem.partitions), 2 if kind == "fixed" else 1)
+
+
+class WorkloadTest(unittest.TestCase):
+    def _run(self, jobs):
+        Process._next_pid = 100
+        sim = Simulator(seed=1, prob_block=20)
+        rec = _Events()
+        sim.add_recorder(rec)
+        sim.set_workload(jobs)
+        sim.run(until_tick=200)
+        return sim, rec.events, _state(sim)
+
+    def test_bad_job_does_not_cut_the_tick(self):
+        good = [Job(0, 4, 30), Job(5, 6, 20), Job(9, 2, 10)]
+        # el trabajo desordenado se lee al llegar el del tick 9: ese tick tiene que
+        # terminar igual que sin él
+        sim, events, state = self._run(good + [Job(3, 2, 10), Job(20, 2, 10)])
+        self.assertIsInstance(sim.workload_error, ValueError)
+        ref, ref_events, ref_state = self._run(good)
+        self.assertIsNone(ref.workload_error)
+        self.assertEqual(events, ref_events)
+        self.assertEqual(state, ref_state)
+
+    def test_readers_reject_invalid_rows(self):
+        bad = {
+            "mem.csv": "arrival,mem,cpu\n0,2,5\n1,0,5\n",
+            "neg.csv": "arrival,mem,cpu\n0,-3,5\n",
+            "cols.csv": "arrival,mem\n0,2\n",
+            "arrival.jsonl": '{"arrival": 0, "mem": 2, "cpu": 5}\n{"arrival": -1, "mem": 2, "cpu": 5}\n',
+            "cpu.jsonl": '{"arrival": 0, "mem": 2, "cpu": 0}\n',
+            "json.jsonl": '{"arrival": 0, "mem": 2, "cpu": 5}\n{roto\n',
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, text in bad.items():
+                path = os.path.join(tmp, name)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                with self.subTest(name=name), self.assertRaisesRegex(ValueError, "línea"):
+                    list(read_workload(path))
+
+
+class TraceReplayTest(unittest.TestCase):
+    @staticmethod
+    def _live(sim):
+        rows = sorted((p.pid, p.state.value, p.mem_required,
+                       p.mem_index if p.mem_index >= 0 else "-",
+                       p.cpu_remaining, sim.io_remaining(p)) for p in sim.all_procs.values())
+        parts = tuple((b.start, b.size, b.owner_pid, b.occupied) for b in sim.mem.partitions)
+        return rows, parts, len(sim.terminated)
+
+    def test_state_at_matches_live_run(self):
+        r = random.Random(3)
+        with tempfile.TemporaryDirectory() as tmp:
+            for trial in range(30):
+                sim = Simulator(
+                    seed=trial, quantum=r.randint(1, 8), prob_block=r.choice((0, 5, 20, 60)),
+                    io_time_range=(1, r.randint(1, 10)), cpu_time_range=(1, r.randint(2, 80)),
+                    partitions_sizes=[r.randint(1, 16) for _ in range(r.randint(1, 10))],
+                    admission=r.choice(ADMISSION_POLICIES), scheduler=r.choice(list(SCHEDULERS)),
+                    memory=r.choice(MEMORY_KINDS), fit=r.choice(("first", "next", "best", "worst")),
+                    compaction=r.random() < 0.5)
+                for _ in range(r.randint(0, 10)):
+                    sim.add_process()
+                path = os.path.join(tmp, f"{trial}.trz")
+                rec = TraceRecorder(path, interval=r.choice((1, 50, 10**9)), per_proc=r.choice((0, 8)))
+                rec.attach(sim)
+                expected = {sim.tick: self._live(sim)}
+                for _ in range(r.randint(50, 300)):
+                    if r.random() < 0.02:
+                        sim.add_process()
+                    if r.random() < 0.005:
+                        sim.configure(partitions_sizes=[r.randint(1, 16) for _ in range(5)],
+                                      memory=r.choice(MEMORY_KINDS))
+                    # state_at(t) incluye lo hecho entre el tick t y el siguiente
+                    expected[sim.tick] = self._live(sim)
+                    sim.run(until_tick=sim.tick + r.randint(1, 20), until_idle=False)
+                    expected[sim.tick] = self._live(sim)
+                rec.detach(sim)
+                rep = TraceReplayer(path)
+                try:
+                    for tick, live in expected.items():
+                        st = rep.state_at(tick)
+                        self.assertEqual((sorted(st.procs), st.partitions, st.terminated), live,
+                                         f"traza {trial}, tick {tick}")
+                finally:
+                    rep.close()
+
+
+class WaitQueueTest(unittest.TestCase):
+    class _Waiter:
+        def __init__(self, mem): self.mem_required, self.wait_seq = mem, None
+
+    @staticmethod
+    def _expected(waiting, max_size, policy):
+        fits = [p for p in waiting if p.mem_required <= max_size]
+        if policy == "fifo":
+            return waiting[0] if waiting and waiting[0].mem_required <= max_size else None
+        if policy == "first":
+            return fits[0] if fits else None
+        # "best": el mayor pedido que entra; entre iguales, el más antiguo
+        return max(fits, key=lambda p: (p.mem_required, -waiting.index(p))) if fits else None
+
+    def test_policies_match_linear_scan(self):
+        r = random.Random(7)
+        for trial in range(800):
+            # a veces muchos tamaños distintos, para que el árbol crezca
+            top = r.choice((12, 5000))
+            waiting = [self._Waiter(r.randint(1, top)) for _ in range(r.randint(0, 30))]
+            queue = WaitQueue(waiting)
+            for _ in range(30):
+                max_size, policy = r.randint(0, top + 2), r.choice(ADMISSION_POLICIES)
+                got = queue.candidate(max_size, policy)
+                self.assertIs(got, self._expected(waiting, max_size, policy),
+                              f"prueba {trial}, {policy}")
+                if got is not None:
+                    queue.remove(got)
+                    waiting.remove(got)
+                if r.random() < 0.3:
+                    p = self._Waiter(r.randint(1, top))
+                    queue.append(p)
+                    waiting.append(p)
+                self.assertEqual(len(queue), len(waiting))
+                self.assertEqual(list(queue), waiting)
+                self.assertIs(queue.head(), waiting[0] if waiting else None)
+
+
+class ProcessTableTest(unittest.TestCase):
+    def test_window_and_position_match_full_sort(self):
+        r = random.Random(6)
+        states = ("Listo", "Ejecutando", "Bloqueado", "Terminado")
+        def row(pid):
+            return (pid, r.choice(states), r.randint(1, 12), r.choice(("-", r.randint(0, 9))),
+                    r.randint(0, 60), r.randint(0, 8))
+        for trial in range(200):
+            table = ProcessTable()
+            rows = {pid: row(pid) for pid in range(r.randint(0, 60))}
+            table.load(rows.values())
+            for _ in range(60):
+                x = r.random()
+                if x < 0.5:
+                    values = row(r.randint(0, 80))
+                    table.update(values)
+                    rows[values[0]] = values
+                elif x < 0.6:
+                    table.set_sort(r.choice(COLUMNS), r.random() < 0.5)
+                elif x < 0.7:
+                    table.set_filter(r.choice(list(FILTERS)))
+                visible = sorted((v for v in rows.values() if row_group(v) in table.groups),
+                                 key=lambda v: sort_key(table.col, v), reverse=table.reverse)
+                self.assertEqual(len(table), len(visible))
+                offset, count = r.randint(0, len(visible) + 3), r.randint(0, 15)
+                self.assertEqual(table.window(offset, count), visible[offset:offset + count],
+                                 f"prueba {trial}, orden {table.col}/{table.reverse}")
+                pid = r.choice(list(rows) + [999])
+                expected = next((i for i, v in enumerate(visible) if v[0] == pid), None)
+                self.assertEqual(table.position(pid), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()